@@ -61,7 +61,8 @@ class NostalgiKitCardGame:
             'retro_small': tkFont.Font(family="Courier", size=8, weight="bold"),
             'retro_large': tkFont.Font(family="Courier", size=12, weight="bold"),
             'retro_tiny': tkFont.Font(family="Courier", size=7, weight="bold"),
-            'retro_number': tkFont.Font(family="Courier", size=9, weight="bold")
+            'retro_number': tkFont.Font(family="Courier", size=9, weight="bold"),
+            'retro_reveal': tkFont.Font(family="Courier", size=32, weight="bold")
         }
         
     def setup_retro_interface(self):
@@ -250,7 +251,7 @@ to begin!"""
             # Big number
             number_label = tk.Label(content,
                                    text=str(guess),
-                                   font=tkFont.Font(family="Courier", size=32, weight="bold"),
+                                   font=self.fonts['retro_reveal'],
                                    fg=self.colors['screen_dark'],
                                    bg=self.colors['screen_green'])
             number_label.pack(expand=True)
@@ -365,42 +366,35 @@ to begin!"""
             print(f"Gamepad init error: {e}")
             self.gamepad_enabled = False
     
+    def _just_pressed(self, btn):
+        """True on the first poll that sees gamepad button btn held down"""
+        try:
+            current = self.joystick.get_button(btn) == 1
+        except:
+            current = False
+        previous = self.last_button_state.get(btn, False)
+        self.last_button_state[btn] = current
+        return current and not previous
+    
     def poll_gamepad(self):
         """Poll gamepad input"""
         if not self.gamepad_enabled or not self.gamepad_polling_active:
             return
         
-        try:
-            self.parent.winfo_toplevel().winfo_exists()
-        except:
-            return
-        
         try:
             pygame.event.pump()
             
             if self.joystick is not None and self.joystick.get_init():
-                def is_pressed(btn):
-                    try:
-                        return self.joystick.get_button(btn) == 1
-                    except:
-                        return False
-                
-                def just_pressed(btn):
-                    current = is_pressed(btn)
-                    previous = self.last_button_state.get(btn, False)
-                    self.last_button_state[btn] = current
-                    return current and not previous
-                
                 # X or A = YES
-                if just_pressed(0) or just_pressed(2):
+                if self._just_pressed(0) or self._just_pressed(2):
                     self.x_button_action()
                 
                 # Y or B = NO
-                if just_pressed(1) or just_pressed(3):
+                if self._just_pressed(1) or self._just_pressed(3):
                     self.y_button_action()
                 
                 # START = restart (from result screen)
-                if just_pressed(7):
+                if self._just_pressed(7):
                     if self.game_stage == "result":
                         self.game_stage = "intro"
                         self.show_intro()
@@ -414,10 +408,9 @@ to begin!"""
             if "bad window" not in str(e):
                 print(f"Gamepad poll error: {e}")
         
-        try:
+        # Exiting clears gamepad_polling_active, so no window probe is needed
+        if self.gamepad_polling_active:
             self.parent.winfo_toplevel().after(30, self.poll_gamepad)
-        except:
-            pass
     
     def show(self):
         """Show game again (reuse instance)"""
@@ -416,13 +416,18 @@ class CrakersGame:
             self.joystick = None
             return None
     
-    def poll_gamepad(self):
-        if not self.gamepad_enabled or not self.gamepad_polling_active:
-            return
-        
+    def _just_pressed(self, btn):
+        """True on the first poll that sees gamepad button btn held down"""
         try:
-            self.parent.winfo_toplevel().winfo_exists()
+            current = self.joystick.get_button(btn) == 1
         except:
+            current = False
+        previous = self.last_button_state.get(btn, False)
+        self.last_button_state[btn] = current
+        return current and not previous
+    
+    def poll_gamepad(self):
+        if not self.gamepad_enabled or not self.gamepad_polling_active:
             return
         
         # Check and ensure gamepad connection
@@ -444,25 +449,13 @@ class CrakersGame:
             pygame.event.pump()
             
             if self.joystick is not None:
-                def is_pressed(btn):
-                    try:
-                        return self.joystick.get_button(btn) == 1
-                    except:
-                        return False
-                
-                def just_pressed(btn):
-                    current = is_pressed(btn)
-                    previous = self.last_button_state.get(btn, False)
-                    self.last_button_state[btn] = current
-                    return current and not previous
-                
-                if just_pressed(self.BTN_A) or just_pressed(self.BTN_X):
+                if self._just_pressed(self.BTN_A) or self._just_pressed(self.BTN_X):
                     self.x_button_pressed()
                 
-                if just_pressed(self.BTN_B) or just_pressed(self.BTN_Y):
+                if self._just_pressed(self.BTN_B) or self._just_pressed(self.BTN_Y):
                     self.y_button_pressed()
                 
-                if just_pressed(self.BTN_START):
+                if self._just_pressed(self.BTN_START):
                     self.start_action()
                 
                 try:
@@ -484,10 +477,9 @@ class CrakersGame:
             if "bad window" not in str(e):
                 print(f"Gamepad poll error: {e}")
         
-        try:
+        # Exiting clears gamepad_polling_active, so no window probe is needed
+        if self.gamepad_polling_active:
             self.parent.winfo_toplevel().after(30, self.poll_gamepad)
-        except:
-            pass
     
     def setup_ui(self):
         """Setup game UI inside hub's screen frame"""
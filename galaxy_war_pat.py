@@ -13,6 +13,91 @@ import random
 import time
 import pygame  # For gamepad support
 
+# Gamepad poll cadence (~33 Hz)
+POLL_PERIOD_NS = 30_000_000
+
+
+def iter_bits(mask):
+    """Yield the index of each set bit in mask, lowest first"""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class Ship:
+    """Player ship"""
+    __slots__ = ('x', 'y', 'width', 'height')
+
+    def __init__(self, x, y, width=30, height=25):
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+
+
+class Invader:
+    """Enemy in the invading formation"""
+    __slots__ = ('x', 'y', 'width', 'height', 'type', 'alive')
+
+    def __init__(self, x, y, enemy_type, width=28, height=22):
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self.type = enemy_type
+        self.alive = True
+
+
+class Bullet:
+    """Player or enemy projectile (fields are filled in on spawn)"""
+    __slots__ = ('x', 'y', 'width', 'height', 'speed')
+
+    def __init__(self):
+        self.x = 0
+        self.y = 0
+        self.width = 3
+        self.height = 10
+        self.speed = 0
+
+
+class Particle:
+    """Explosion particle (fields are filled in on spawn)"""
+    __slots__ = ('x', 'y', 'dx', 'dy', 'life')
+
+    def __init__(self):
+        self.x = 0
+        self.y = 0
+        self.dx = 0
+        self.dy = 0
+        self.life = 0
+
+
+class ObjectPool:
+    """Preallocated free list so spawning during play doesn't allocate"""
+    __slots__ = ('factory', 'free')
+
+    def __init__(self, factory, size):
+        self.factory = factory
+        self.free = [factory() for _ in range(size)]
+
+    def acquire(self):
+        """Take an object from the pool (grows if exhausted)"""
+        if self.free:
+            return self.free.pop()
+        return self.factory()
+
+    def release(self, obj):
+        """Return an object to the pool"""
+        self.free.append(obj)
+
+    def reset_all(self, *active_lists):
+        """Return every live object to the pool, emptying the lists in place"""
+        for items in active_lists:
+            self.free.extend(items)
+            items.clear()
+
+
 class GalaxyWarPat:
     def __init__(self, parent, return_callback):
         self.parent = parent
@@ -41,6 +126,10 @@ class GalaxyWarPat:
         self.enemy_bullets = []
         self.particles = []
         
+        # Preallocated projectile/particle storage
+        self.bullet_pool = ObjectPool(Bullet, 64)
+        self.particle_pool = ObjectPool(Particle, 256)
+        
         # Movement
         self.move_left = False
         self.move_right = False
@@ -169,6 +258,15 @@ class GalaxyWarPat:
             self.BTN_Y = 3
             self.BTN_START = 7
             
+            # Button dispatch table (resolved once, looked up per press)
+            self._btn_handlers = {
+                self.BTN_A: self._on_fire_button,
+                self.BTN_X: self._on_fire_button,
+                self.BTN_B: self.quit_game,
+                self.BTN_Y: self.quit_game,
+                self.BTN_START: self.toggle_pause
+            }
+            
             # Connect gamepad
             if pygame.joystick.get_count() > 0:
                 self.joystick = pygame.joystick.Joystick(0)
@@ -176,7 +274,8 @@ class GalaxyWarPat:
                 print(f"Gamepad connected to game: {self.joystick.get_name()}")
             
             # Start polling
-            self.parent.winfo_toplevel().after(30, self.poll_gamepad)
+            self._next_poll_ns = time.perf_counter_ns()
+            self.schedule_next_poll()
             
         except Exception as e:
             print(f"Gamepad init error in game: {e}")
@@ -197,31 +296,21 @@ class GalaxyWarPat:
             pygame.event.pump()
             
             if self.joystick is not None and self.joystick.get_init():
-                # Helper functions
-                def is_pressed(btn):
+                # Collect just-pressed buttons (edge-trigger) into a bitmask
+                pressed_mask = 0
+                for btn in self._btn_handlers:
                     try:
-                        return self.joystick.get_button(btn) == 1
+                        current = self.joystick.get_button(btn) == 1
                     except:
-                        return False
-                
-                def just_pressed(btn):
-                    current = is_pressed(btn)
-                    previous = self.last_button_state.get(btn, False)
+                        current = False
+                    if current and not self.last_button_state.get(btn, False):
+                        pressed_mask |= 1 << btn
                     self.last_button_state[btn] = current
-                    return current and not previous
-                
-                # Buttons
-                if just_pressed(self.BTN_A) or just_pressed(self.BTN_X):
-                    if not self.game_active:
-                        self.start_game_from_screen()
-                    else:
-                        self.shoot()
-                
-                if just_pressed(self.BTN_B) or just_pressed(self.BTN_Y):
-                    self.quit_game()
                 
-                if just_pressed(self.BTN_START):
-                    self.toggle_pause()
+                # Dispatch each handler at most once per poll
+                handlers = dict.fromkeys(self._btn_handlers[btn] for btn in iter_bits(pressed_mask))
+                for handler in handlers:
+                    handler()
                 
                 # D-Pad and analog stick for movement
                 try:
@@ -253,10 +342,27 @@ class GalaxyWarPat:
         
         # Continue polling
         try:
-            self.parent.winfo_toplevel().after(30, self.poll_gamepad)
+            self.schedule_next_poll()
         except:
             pass
         
+    def schedule_next_poll(self):
+        """Schedule the next poll against a fixed deadline so timer drift doesn't accumulate"""
+        now = time.perf_counter_ns()
+        self._next_poll_ns += POLL_PERIOD_NS
+        if self._next_poll_ns < now:
+            # Fell more than a period behind - resync instead of bursting
+            self._next_poll_ns = now + POLL_PERIOD_NS
+        delay_ms = max(0, (self._next_poll_ns - now) // 1_000_000)
+        self.parent.winfo_toplevel().after(delay_ms, self.poll_gamepad)
+        
+    def _on_fire_button(self):
+        """A/X button: start from the title screen, shoot while playing"""
+        if not self.game_active:
+            self.start_game_from_screen()
+        else:
+            self.shoot()
+            
     def set_move_left(self, value):
         """Set left movement flag"""
         self.move_left = value
@@ -313,19 +419,11 @@ class GalaxyWarPat:
         self.lives = 3
         self.level = 1
         
-        # Clear objects
-        self.bullets = []
-        self.enemies = []
-        self.enemy_bullets = []
-        self.particles = []
+        # Clear objects (in place, so held references stay valid)
+        self.clear_objects()
         
         # Create player
-        self.player = {
-            'x': self.canvas_width // 2,
-            'y': self.canvas_height - 60,
-            'width': 30,
-            'height': 25
-        }
+        self.player = Ship(self.canvas_width // 2, self.canvas_height - 60)
         
         # Create first wave
         self.create_enemy_wave()
@@ -336,9 +434,15 @@ class GalaxyWarPat:
         # Start game loop
         self.game_loop()
         
+    def clear_objects(self):
+        """Drop all enemies and hand bullets/particles back to their pools"""
+        self.enemies.clear()
+        self.bullet_pool.reset_all(self.bullets, self.enemy_bullets)
+        self.particle_pool.reset_all(self.particles)
+        
     def create_enemy_wave(self):
         """Create a wave of enemies"""
-        self.enemies = []
+        self.enemies.clear()
         rows = 3 + (self.level - 1) // 2  # More rows as level increases
         cols = 7
         spacing_x = 45
@@ -349,14 +453,9 @@ class GalaxyWarPat:
         for row in range(rows):
             for col in range(cols):
                 enemy_type = (row % 3) + 1  # 3 different enemy types
-                enemy = {
-                    'x': start_x + col * spacing_x,
-                    'y': start_y + row * spacing_y,
-                    'width': 28,
-                    'height': 22,
-                    'type': enemy_type,
-                    'alive': True
-                }
+                enemy = Invader(start_x + col * spacing_x,
+                                start_y + row * spacing_y,
+                                enemy_type)
                 self.enemies.append(enemy)
                 
     def draw_player_ship(self, x, y):
@@ -444,13 +543,12 @@ class GalaxyWarPat:
             
         current_time = time.time()
         if current_time - self.last_shot_time >= self.shot_cooldown:
-            bullet = {
-                'x': self.player['x'],
-                'y': self.player['y'] - 15,
-                'width': 3,
-                'height': 10,
-                'speed': self.bullet_speed
-            }
+            bullet = self.bullet_pool.acquire()
+            bullet.x = self.player.x
+            bullet.y = self.player.y - 15
+            bullet.width = 3
+            bullet.height = 10
+            bullet.speed = self.bullet_speed
             self.bullets.append(bullet)
             self.last_shot_time = current_time
             
@@ -462,25 +560,24 @@ class GalaxyWarPat:
         current_time = time.time()
         if current_time - self.last_enemy_shot_time >= self.enemy_shot_cooldown:
             # Choose a random alive enemy from bottom rows
-            bottom_enemies = [e for e in self.enemies if e['alive']]
+            bottom_enemies = [e for e in self.enemies if e.alive]
             if bottom_enemies:
                 shooter = random.choice(bottom_enemies)
-                bullet = {
-                    'x': shooter['x'],
-                    'y': shooter['y'] + 15,
-                    'width': 3,
-                    'height': 8,
-                    'speed': self.enemy_bullet_speed
-                }
+                bullet = self.bullet_pool.acquire()
+                bullet.x = shooter.x
+                bullet.y = shooter.y + 15
+                bullet.width = 3
+                bullet.height = 8
+                bullet.speed = self.enemy_bullet_speed
                 self.enemy_bullets.append(bullet)
                 self.last_enemy_shot_time = current_time
                 
     def move_player(self):
         """Move player based on input"""
-        if self.move_left and self.player['x'] > 20:
-            self.player['x'] -= self.player_speed
-        if self.move_right and self.player['x'] < self.canvas_width - 20:
-            self.player['x'] += self.player_speed
+        if self.move_left and self.player.x > 20:
+            self.player.x -= self.player_speed
+        if self.move_right and self.player.x < self.canvas_width - 20:
+            self.player.x += self.player_speed
             
     def move_enemies(self):
         """Move all enemies in formation"""
@@ -493,10 +590,10 @@ class GalaxyWarPat:
         # Check if any enemy hits the edge
         hit_edge = False
         for enemy in self.enemies:
-            if enemy['alive']:
-                half_w = enemy['width'] // 2
-                if (enemy['x'] - half_w <= 0 and self.enemy_direction == -1) or \
-                   (enemy['x'] + half_w >= self.canvas_width and self.enemy_direction == 1):
+            if enemy.alive:
+                half_w = enemy.width // 2
+                if (enemy.x - half_w <= 0 and self.enemy_direction == -1) or \
+                   (enemy.x + half_w >= self.canvas_width and self.enemy_direction == 1):
                     hit_edge = True
                     break
         
@@ -505,49 +602,52 @@ class GalaxyWarPat:
             # Drop down and reverse direction
             self.enemy_direction *= -1
             for enemy in self.enemies:
-                if enemy['alive']:
-                    enemy['y'] += self.enemy_drop_distance
-                    half_w = enemy['width'] // 2
+                if enemy.alive:
+                    enemy.y += self.enemy_drop_distance
+                    half_w = enemy.width // 2
                     # Keep enemies fully on-screen after drops
-                    enemy['x'] = max(half_w, min(self.canvas_width - half_w, enemy['x']))
+                    enemy.x = max(half_w, min(self.canvas_width - half_w, enemy.x))
                     
             # Speed up as enemies get closer
             self.enemy_move_interval *= 0.95
         else:
             # Move horizontally
             for enemy in self.enemies:
-                if enemy['alive']:
-                    half_w = enemy['width'] // 2
-                    new_x = enemy['x'] + self.enemy_speed * self.enemy_direction
+                if enemy.alive:
+                    half_w = enemy.width // 2
+                    new_x = enemy.x + self.enemy_speed * self.enemy_direction
                     min_x = half_w
                     max_x = self.canvas_width - half_w
-                    enemy['x'] = max(min_x, min(max_x, new_x))
+                    enemy.x = max(min_x, min(max_x, new_x))
                     
     def update_bullets(self):
         """Update bullet positions"""
         # Player bullets
         for bullet in self.bullets[:]:
-            bullet['y'] -= bullet['speed']
-            if bullet['y'] < 0:
+            bullet.y -= bullet.speed
+            if bullet.y < 0:
                 self.bullets.remove(bullet)
+                self.bullet_pool.release(bullet)
                 
         # Enemy bullets
         for bullet in self.enemy_bullets[:]:
-            bullet['y'] += bullet['speed']
-            if bullet['y'] > self.canvas_height:
+            bullet.y += bullet.speed
+            if bullet.y > self.canvas_height:
                 self.enemy_bullets.remove(bullet)
+                self.bullet_pool.release(bullet)
                 
     def check_collisions(self):
         """Check for all collisions"""
         # Player bullets hitting enemies
         for bullet in self.bullets[:]:
             for enemy in self.enemies:
-                if enemy['alive'] and self.check_collision(bullet, enemy):
-                    enemy['alive'] = False
+                if enemy.alive and self.check_collision(bullet, enemy):
+                    enemy.alive = False
                     if bullet in self.bullets:
                         self.bullets.remove(bullet)
-                    self.score += 10 * enemy['type']
-                    self.create_explosion(enemy['x'], enemy['y'])
+                        self.bullet_pool.release(bullet)
+                    self.score += 10 * enemy.type
+                    self.create_explosion(enemy.x, enemy.y)
                     break
                     
         # Enemy bullets hitting player
@@ -555,25 +655,26 @@ class GalaxyWarPat:
             if self.check_collision(bullet, self.player):
                 if bullet in self.enemy_bullets:
                     self.enemy_bullets.remove(bullet)
+                    self.bullet_pool.release(bullet)
                 self.player_hit()
                 
         # Check if enemies reached player
         for enemy in self.enemies:
-            if enemy['alive'] and enemy['y'] + enemy['height'] >= self.player['y']:
+            if enemy.alive and enemy.y + enemy.height >= self.player.y:
                 self.game_over = True
                 self.show_game_over("ENEMIES INVADED!")
                 
     def check_collision(self, obj1, obj2):
         """Check if two objects collide"""
-        return (obj1['x'] - obj1.get('width', 5) // 2 < obj2['x'] + obj2['width'] // 2 and
-                obj1['x'] + obj1.get('width', 5) // 2 > obj2['x'] - obj2['width'] // 2 and
-                obj1['y'] - obj1.get('height', 5) // 2 < obj2['y'] + obj2['height'] // 2 and
-                obj1['y'] + obj1.get('height', 5) // 2 > obj2['y'] - obj2['height'] // 2)
+        return (obj1.x - obj1.width // 2 < obj2.x + obj2.width // 2 and
+                obj1.x + obj1.width // 2 > obj2.x - obj2.width // 2 and
+                obj1.y - obj1.height // 2 < obj2.y + obj2.height // 2 and
+                obj1.y + obj1.height // 2 > obj2.y - obj2.height // 2)
                 
     def player_hit(self):
         """Handle player being hit"""
         self.lives -= 1
-        self.create_explosion(self.player['x'], self.player['y'])
+        self.create_explosion(self.player.x, self.player.y)
         
         if self.lives <= 0:
             self.game_over = True
@@ -584,27 +685,27 @@ class GalaxyWarPat:
     def create_explosion(self, x, y):
         """Create explosion particles"""
         for _ in range(8):
-            particle = {
-                'x': x,
-                'y': y,
-                'dx': random.uniform(-3, 3),
-                'dy': random.uniform(-3, 3),
-                'life': 15
-            }
+            particle = self.particle_pool.acquire()
+            particle.x = x
+            particle.y = y
+            particle.dx = random.uniform(-3, 3)
+            particle.dy = random.uniform(-3, 3)
+            particle.life = 15
             self.particles.append(particle)
             
     def update_particles(self):
         """Update explosion particles"""
         for particle in self.particles[:]:
-            particle['x'] += particle['dx']
-            particle['y'] += particle['dy']
-            particle['life'] -= 1
-            if particle['life'] <= 0:
+            particle.x += particle.dx
+            particle.y += particle.dy
+            particle.life -= 1
+            if particle.life <= 0:
                 self.particles.remove(particle)
+                self.particle_pool.release(particle)
                 
     def check_wave_complete(self):
         """Check if all enemies are destroyed"""
-        if all(not enemy['alive'] for enemy in self.enemies):
+        if all(not enemy.alive for enemy in self.enemies):
             self.level += 1
             self.enemy_move_interval = 0.5  # Reset speed
             self.create_enemy_wave()
@@ -616,20 +717,20 @@ class GalaxyWarPat:
         
         # Draw player
         if not self.game_over:
-            self.draw_player_ship(self.player['x'], self.player['y'])
+            self.draw_player_ship(self.player.x, self.player.y)
         
         # Draw enemies
         for enemy in self.enemies:
-            if enemy['alive']:
-                self.draw_custom_enemy(enemy['x'], enemy['y'], enemy['type'])
+            if enemy.alive:
+                self.draw_custom_enemy(enemy.x, enemy.y, enemy.type)
         
         # Draw bullets
         for bullet in self.bullets:
             self.canvas.create_rectangle(
-                bullet['x'] - bullet['width'] // 2,
-                bullet['y'] - bullet['height'] // 2,
-                bullet['x'] + bullet['width'] // 2,
-                bullet['y'] + bullet['height'] // 2,
+                bullet.x - bullet.width // 2,
+                bullet.y - bullet.height // 2,
+                bullet.x + bullet.width // 2,
+                bullet.y + bullet.height // 2,
                 fill=self.colors['bullet_color'],
                 outline=''
             )
@@ -637,22 +738,22 @@ class GalaxyWarPat:
         # Draw enemy bullets
         for bullet in self.enemy_bullets:
             self.canvas.create_oval(
-                bullet['x'] - bullet['width'] // 2,
-                bullet['y'] - bullet['height'] // 2,
-                bullet['x'] + bullet['width'] // 2,
-                bullet['y'] + bullet['height'] // 2,
+                bullet.x - bullet.width // 2,
+                bullet.y - bullet.height // 2,
+                bullet.x + bullet.width // 2,
+                bullet.y + bullet.height // 2,
                 fill=self.colors['enemy_bullet_color'],
                 outline=''
             )
             
         # Draw particles
         for particle in self.particles:
-            alpha = particle['life'] / 15.0
+            alpha = particle.life / 15.0
             self.canvas.create_oval(
-                particle['x'] - 3,
-                particle['y'] - 3,
-                particle['x'] + 3,
-                particle['y'] + 3,
+                particle.x - 3,
+                particle.y - 3,
+                particle.x + 3,
+                particle.y + 3,
                 fill=self.colors['particle_color'],
                 outline=''
             )
@@ -757,6 +858,9 @@ class GalaxyWarPat:
         self.game_active = False
         self.game_over = False
         
+        # Stop polling so show() starts a single fresh poll chain
+        self.gamepad_polling_active = False
+        
         # Unbind keys from root window
         root_window = self.parent.winfo_toplevel()
         root_window.unbind('<Left>')
@@ -781,10 +885,7 @@ class GalaxyWarPat:
         self.paused = False
         
         self.player = None
-        self.bullets = []
-        self.enemies = []
-        self.enemy_bullets = []
-        self.particles = []
+        self.clear_objects()
         
         self.move_left = False
         self.move_right = False
@@ -802,7 +903,8 @@ class GalaxyWarPat:
         # Gamepad'i yeniden başlat
         if self.gamepad_enabled:
             self.gamepad_polling_active = True
-            self.parent.winfo_toplevel().after(100, self.poll_gamepad)
+            self._next_poll_ns = time.perf_counter_ns()
+            self.schedule_next_poll()
 
 
 def main():
@@ -8,27 +8,75 @@ Licensed under MIT License - see LICENSE file for details
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-import tkinter.font as tkFont
 from tkinter import PhotoImage
 import random
-import threading
 import time
 import os
 import tempfile
-from PIL import Image, ImageTk, ImageDraw, ImageFilter
+import logging
+import importlib
+from types import SimpleNamespace
+from PIL import Image, ImageTk
 import io
 import base64
-import pygame  # For gamepad support
+from nostalgik_common import RETRO_FONTS, SyntheticKeyEvent, get_fonts
 
-# Import NostalgiKit games
-from card_guess_nostalgik import CardGuessGame
-from war_game_nostalgik import WarGame
-from river_game_nostalgik import RiverGame
-from galaxy_war_pat import GalaxyWarPat
-from crakers_nostalgik import CrakersGame
-from tetris_nostalgik import TetrisGame
+# Diagnostics; main.py enables debug output when NOSTALGIKIT_DEBUG=1
+log = logging.getLogger('nostalgikit')
+
+# Gamepad button mapping (XInput standard)
+BTN_A = 0      # A button (OK/Confirm)
+BTN_B = 1      # B button (Back)
+BTN_X = 2      # X button
+BTN_Y = 3      # Y button
+BTN_LB = 4     # Left bumper
+BTN_RB = 5     # Right bumper
+BTN_BACK = 6   # Back/Select button
+BTN_START = 7  # Start button
+
+# pygame and the NostalgiKit game modules are imported on first use so the
+# hub window comes up without waiting for SDL or the game modules to load
+# (see init_gamepad and launch_game)
 
 class NostalgiKitHub:
+    # Battery indicator text for each level (0-4 blocks)
+    _BATTERY_STRINGS = tuple(f"BATTERY {'▓' * i}{'▒' * (4 - i)}" for i in range(5))
+
+    # Presses of the same button closer together than this are contact bounce
+    _ACTION_DEBOUNCE_S = 0.030
+
+    # Menu entries in order: (instance key, loading title, module, class)
+    _GAME_SPECS = (
+        ('card_game', "NUMBER ORACLE", 'card_guess_nostalgik', 'CardGuessGame'),
+        ('war_game', "WAR GAME", 'war_game_nostalgik', 'WarGame'),
+        ('river_game', "RIVER PUZZLE", 'river_game_nostalgik', 'RiverGame'),
+        ('galaxy_war', "GALAXY WAR PAT", 'galaxy_war_pat', 'GalaxyWarPat'),
+        ('crakers_game', "CRAKERS QUEST", 'crakers_nostalgik', 'CrakersGame'),
+        ('tetris_game', "BLOCK STACK", 'tetris_nostalgik', 'TetrisGame'),
+    )
+
+    # Hub key bindings: (sequence, action, argument)
+    _KEY_BINDINGS = (
+        # Arrow keys and WASD for D-Pad
+        ('<Up>', 'dpad', 'UP'),
+        ('<Down>', 'dpad', 'DOWN'),
+        ('<Left>', 'dpad', 'LEFT'),
+        ('<Right>', 'dpad', 'RIGHT'),
+        ('<w>', 'dpad', 'UP'),
+        ('<s>', 'dpad', 'DOWN'),
+        ('<a>', 'dpad', 'LEFT'),
+        ('<d>', 'dpad', 'RIGHT'),
+        # Action buttons
+        ('<Return>', 'x', None),     # Enter = X button
+        ('<space>', 'x', None),      # Space = X button
+        ('<x>', 'x', None),          # X = X button
+        ('<Escape>', 'y', None),     # Escape = Y button
+        ('<BackSpace>', 'y', None),  # Backspace = Y button
+        ('<y>', 'y', None),          # Y = Y button
+        # SELECT and START
+        ('<Tab>', 'select', None),   # Tab = SELECT
+    )
+
     def __init__(self):
         self.root = tk.Tk()
         self.root.title("NostalgiKit")
@@ -41,15 +89,18 @@ class NostalgiKitHub:
             if os.path.exists(icon_path):
                 # Try with PIL first for better compatibility
                 try:
-                    pil_image = Image.open(icon_path)
-                    # Resize if necessary for icon
-                    if pil_image.size != (32, 32):
-                        pil_image = pil_image.resize((32, 32), Image.Resampling.LANCZOS)
+                    # Decode once; the 32x32 image feeds both icon paths
+                    with Image.open(icon_path) as original:
+                        # Resize if necessary for icon (BILINEAR is plenty at 32x32)
+                        if original.size != (32, 32):
+                            pil_image = original.resize((32, 32), Image.Resampling.BILINEAR)
+                        else:
+                            pil_image = original.copy()
                     self.icon = ImageTk.PhotoImage(pil_image)
                     self.root.iconphoto(False, self.icon)
 
                     # Generate an .ico for taskbar if possible
-                    self.icon_taskbar_path = self.generate_taskbar_icon(icon_path)
+                    self.icon_taskbar_path = self.generate_taskbar_icon(pil_image, icon_path)
                     if self.icon_taskbar_path:
                         try:
                             self.root.iconbitmap(default=self.icon_taskbar_path)
@@ -71,26 +122,20 @@ class NostalgiKitHub:
         self.style.theme_use('clam')
         
         # NostalgiKit colors (vintage cream theme like original image)
-        self.colors = {
-            'nostalgik_cream': '#E8E0C7',      # Main vintage cream color
-            'screen_green': '#9BBB59',        # Classic green screen
-            'dark_green': '#8B9467',          # Dark accents
-            'screen_dark': '#374224',         # Dark screen areas
-            'button_gray': '#8E8E93',         # Button color
-            'text_dark': '#1C1C1E',           # Dark text
-            'highlight': '#FFD23F',           # Yellow highlight
-            'red_button': '#FF3B30',          # X button (red)
-            'purple_button': '#8E44AD'        # Y button (purple)
-        }
+        self.colors = SimpleNamespace(
+            nostalgik_cream='#E8E0C7',      # Main vintage cream color
+            screen_green='#9BBB59',        # Classic green screen
+            dark_green='#8B9467',          # Dark accents
+            screen_dark='#374224',         # Dark screen areas
+            button_gray='#8E8E93',         # Button color
+            text_dark='#1C1C1E',           # Dark text
+            highlight='#FFD23F',           # Yellow highlight
+            red_button='#FF3B30',          # X button (red)
+            purple_button='#8E44AD'         # Y button (purple)
+        )
         
         # Font setup
-        self.fonts = {
-            'retro_title': tkFont.Font(family="Courier", size=10, weight="bold"),
-            'retro_text': tkFont.Font(family="Courier", size=9, weight="bold"),
-            'retro_small': tkFont.Font(family="Courier", size=8, weight="bold"),
-            'retro_large': tkFont.Font(family="Courier", size=12, weight="bold"),
-            'retro_tiny': tkFont.Font(family="Courier", size=7, weight="bold")
-        }
+        self.fonts = get_fonts(self.root, RETRO_FONTS)
         
         # Game state
         self.current_screen = "menu"
@@ -114,11 +159,34 @@ class NostalgiKitHub:
             'tetris_game': None
         }
         
+        # Hub screen frames, built once and re-packed on later visits
+        self._screens = {}
+        
+        # Menu rows (frame, name, description, name text) and pending selection redraw
+        self._menu_rows = []
+        self._menu_selected_row = None
+        self._menu_redraw_pending = False
+        
+        # Last accepted press time per hub button, for debouncing
+        self._last_action_ts = {}
+        
+        # Game currently on screen (set by launch_game)
+        self._active_game = None
+        
+        # Per-game button handlers, resolved on first use
+        self.game_dispatch = {}
+        
         # Battery level (simulation)
         self.battery_level = 3  # 0-4 blocks
         
-        # Gamepad support
-        self.init_gamepad()
+        # Gamepad support (SDL is brought up once the window is idle)
+        self.gamepad_enabled = False
+        self._gamepad_poller = None  # Shared poller, set by init_gamepad
+        self._gamepad_active = False
+        self.root.after_idle(self.init_gamepad)
+        
+        # Hub key bindings currently in place: (sequence, funcid)
+        self._key_funcids = []
         
         # Setup the interface
         self.setup_nostalgik_interface()
@@ -127,24 +195,19 @@ class NostalgiKitHub:
         # Show blank screen first, then welcome screen after 0.5 seconds
         self.show_blank_screen()
         self.root.after(500, self.show_welcome_screen)
-        
-        # Start gamepad polling
-        if self.gamepad_enabled:
-            self.gamepad_polling_active = True
-            self.root.after(100, self.poll_gamepad)
 
     def setup_nostalgik_interface(self):
         """Create the authentic NostalgiKit handheld interface"""
         # Configure main window
-        self.root.configure(bg=self.colors['nostalgik_cream'])        # Setup keyboard focus
+        self.root.configure(bg=self.colors.nostalgik_cream)        # Setup keyboard focus
         self.root.focus_set()
         
         # Main NostalgiKit frame (larger with more padding)
-        main_frame = tk.Frame(self.root, bg=self.colors['nostalgik_cream'], relief='raised', bd=3)
+        main_frame = tk.Frame(self.root, bg=self.colors.nostalgik_cream, relief='raised', bd=3)
         main_frame.pack(fill='both', expand=True, padx=18, pady=18)
 
         # Top section with branding area (taller for larger console)
-        top_frame = tk.Frame(main_frame, bg=self.colors['nostalgik_cream'], height=50)
+        top_frame = tk.Frame(main_frame, bg=self.colors.nostalgik_cream, height=50)
         top_frame.pack(fill='x', pady=(12, 8))
         top_frame.pack_propagate(False)
 
@@ -152,24 +215,24 @@ class NostalgiKitHub:
         brand_label = tk.Label(top_frame,
                               text="NostalgiKIT",
                               font=self.fonts['retro_title'],
-                              fg=self.colors['text_dark'],
-                              bg=self.colors['nostalgik_cream'])
+                              fg=self.colors.text_dark,
+                              bg=self.colors.nostalgik_cream)
         brand_label.pack()
 
         # Model designation
         nostalgik_label = tk.Label(top_frame,
                                 text="CLASSIC",
                                 font=self.fonts['retro_small'],
-                                fg=self.colors['text_dark'],
-                                bg=self.colors['nostalgik_cream'])
+                                fg=self.colors.text_dark,
+                                bg=self.colors.nostalgik_cream)
         nostalgik_label.pack()
         
         # Screen frame (larger with more padding)
-        screen_frame = tk.Frame(main_frame, bg=self.colors['dark_green'], relief='sunken', bd=3)
+        screen_frame = tk.Frame(main_frame, bg=self.colors.dark_green, relief='sunken', bd=3)
         screen_frame.pack(fill='both', expand=True, padx=25, pady=12)
         
         # Screen label
-        screen_label_frame = tk.Frame(screen_frame, bg=self.colors['dark_green'], height=25)
+        screen_label_frame = tk.Frame(screen_frame, bg=self.colors.dark_green, height=25)
         screen_label_frame.pack(fill='x', padx=12, pady=6)
         screen_label_frame.pack_propagate(False)
         
@@ -178,15 +241,15 @@ class NostalgiKitHub:
                               text="DOT MATRIX WITH STEREO SOUND",
                               font=self.fonts['retro_tiny'],
                               fg='#6B7458',  # Faded greenish color
-                              bg=self.colors['dark_green'])
+                              bg=self.colors.dark_green)
         screen_info.pack()
 
         # Actual screen (larger padding)
-        self.screen = tk.Frame(screen_frame, bg=self.colors['screen_green'], relief='sunken', bd=2)
+        self.screen = tk.Frame(screen_frame, bg=self.colors.screen_green, relief='sunken', bd=2)
         self.screen.pack(fill='both', expand=True, padx=12, pady=(0, 12))
         
         # Battery indicator in bottom right corner
-        battery_frame = tk.Frame(screen_frame, bg=self.colors['dark_green'])
+        battery_frame = tk.Frame(screen_frame, bg=self.colors.dark_green)
         battery_frame.pack(side='bottom', anchor='e', padx=12, pady=(0, 6))
         
         battery_text = self.get_battery_display()
@@ -194,45 +257,44 @@ class NostalgiKitHub:
                                       text=battery_text,
                                       font=self.fonts['retro_tiny'],
                                       fg='#6B7458',  # Faded color
-                                      bg=self.colors['dark_green'])
+                                      bg=self.colors.dark_green)
         self.battery_label.pack()
 
         # Create controls
         self.create_controls(main_frame)
 
-    def generate_taskbar_icon(self, png_path):
-        """Create a temporary .ico from the png to show in taskbar (Windows)."""
+    def generate_taskbar_icon(self, pil_image, png_path):
+        """Save the decoded 32x32 icon as a temporary .ico for the taskbar (Windows)."""
         try:
             ico_dir = tempfile.gettempdir()
             ico_path = os.path.join(ico_dir, "nostalgikit_icon.ico")
-            with Image.open(png_path) as img:
-                # Ensure square 32x32 for ico
-                if img.size != (32, 32):
-                    img = img.resize((32, 32), Image.Resampling.LANCZOS)
-                img.save(ico_path, format="ICO")
+            # Reuse the ICO from a previous run unless the PNG is newer
+            if os.path.exists(ico_path) and os.path.getmtime(ico_path) >= os.path.getmtime(png_path):
+                return ico_path
+            pil_image.save(ico_path, format="ICO")
             return ico_path
         except Exception:
             return None
 
     def create_controls(self, parent):
         """Create NostalgiKit control layout (larger spacing for bigger console)"""
-        control_frame = tk.Frame(parent, bg=self.colors['nostalgik_cream'])
+        control_frame = tk.Frame(parent, bg=self.colors.nostalgik_cream)
         control_frame.pack(fill='x', padx=25, pady=(0, 18))
         
         # Control layout
-        controls_layout = tk.Frame(control_frame, bg=self.colors['nostalgik_cream'])
+        controls_layout = tk.Frame(control_frame, bg=self.colors.nostalgik_cream)
         controls_layout.pack()
         
         # D-Pad (left side) - more spacing
-        dpad_frame = tk.Frame(controls_layout, bg=self.colors['nostalgik_cream'])
+        dpad_frame = tk.Frame(controls_layout, bg=self.colors.nostalgik_cream)
         dpad_frame.pack(side='left', padx=(0, 60))
         
         # Action buttons (right side)
-        buttons_frame = tk.Frame(controls_layout, bg=self.colors['nostalgik_cream'])
+        buttons_frame = tk.Frame(controls_layout, bg=self.colors.nostalgik_cream)
         buttons_frame.pack(side='right')
         
         # Bottom row controls - more spacing
-        bottom_controls = tk.Frame(control_frame, bg=self.colors['nostalgik_cream'])
+        bottom_controls = tk.Frame(control_frame, bg=self.colors.nostalgik_cream)
         bottom_controls.pack(pady=(25, 0))
         
         # Create D-Pad and buttons
@@ -242,7 +304,7 @@ class NostalgiKitHub:
         
     def create_dpad(self, parent):
         """Create D-Pad controller"""
-        dpad_container = tk.Frame(parent, bg=self.colors['nostalgik_cream'])
+        dpad_container = tk.Frame(parent, bg=self.colors.nostalgik_cream)
         dpad_container.pack()
         
         # D-Pad buttons arranged in cross pattern
@@ -250,8 +312,8 @@ class NostalgiKitHub:
         up_btn = tk.Button(dpad_container,
                           text="▲",
                           font=self.fonts['retro_text'],
-                          bg=self.colors['button_gray'],
-                          fg=self.colors['text_dark'],
+                          bg=self.colors.button_gray,
+                          fg=self.colors.text_dark,
                           relief='raised',
                           bd=3,
                           width=3,
@@ -264,8 +326,8 @@ class NostalgiKitHub:
         left_btn = tk.Button(dpad_container,
                             text="◄",
                             font=self.fonts['retro_text'],
-                            bg=self.colors['button_gray'],
-                            fg=self.colors['text_dark'],
+                            bg=self.colors.button_gray,
+                            fg=self.colors.text_dark,
                             relief='raised',
                             bd=3,
                             width=3,
@@ -274,15 +336,15 @@ class NostalgiKitHub:
                             takefocus=False)
         left_btn.grid(row=1, column=0, padx=1, pady=1)
         
-        center_frame = tk.Frame(dpad_container, bg=self.colors['button_gray'], width=30, height=20, relief='sunken', bd=1)
+        center_frame = tk.Frame(dpad_container, bg=self.colors.button_gray, width=30, height=20, relief='sunken', bd=1)
         center_frame.grid(row=1, column=1, padx=1, pady=1)
         center_frame.grid_propagate(False)
         
         right_btn = tk.Button(dpad_container,
                              text="►",
                              font=self.fonts['retro_text'],
-                             bg=self.colors['button_gray'],
-                             fg=self.colors['text_dark'],
+                             bg=self.colors.button_gray,
+                             fg=self.colors.text_dark,
                              relief='raised',
                              bd=3,
                              width=3,
@@ -295,8 +357,8 @@ class NostalgiKitHub:
         down_btn = tk.Button(dpad_container,
                             text="▼",
                             font=self.fonts['retro_text'],
-                            bg=self.colors['button_gray'],
-                            fg=self.colors['text_dark'],
+                            bg=self.colors.button_gray,
+                            fg=self.colors.text_dark,
                             relief='raised',
                             bd=3,
                             width=3,
@@ -307,14 +369,14 @@ class NostalgiKitHub:
         
     def create_action_buttons(self, parent):
         """Create X and Y action buttons"""
-        button_container = tk.Frame(parent, bg=self.colors['nostalgik_cream'])
+        button_container = tk.Frame(parent, bg=self.colors.nostalgik_cream)
         button_container.pack()
         
         # X button (bottom right, red)
         x_button = tk.Button(button_container,
                             text="X",
                             font=self.fonts['retro_text'],
-                            bg=self.colors['red_button'],
+                            bg=self.colors.red_button,
                             fg='white',
                             relief='raised',
                             bd=4,
@@ -328,7 +390,7 @@ class NostalgiKitHub:
         y_button = tk.Button(button_container,
                             text="Y",
                             font=self.fonts['retro_text'],
-                            bg=self.colors['purple_button'],
+                            bg=self.colors.purple_button,
                             fg='white',
                             relief='raised',
                             bd=4,
@@ -341,15 +403,15 @@ class NostalgiKitHub:
     def create_select_start_buttons(self, parent):
         """Create SELECT and START buttons"""
         # SELECT and START in classic layout
-        select_start_frame = tk.Frame(parent, bg=self.colors['nostalgik_cream'])
+        select_start_frame = tk.Frame(parent, bg=self.colors.nostalgik_cream)
         select_start_frame.pack()
         
         # SELECT button
         select_btn = tk.Button(select_start_frame,
                               text="SELECT",
                               font=self.fonts['retro_small'],
-                              bg=self.colors['button_gray'],
-                              fg=self.colors['text_dark'],
+                              bg=self.colors.button_gray,
+                              fg=self.colors.text_dark,
                               relief='raised',
                               bd=2,
                               padx=8,
@@ -362,8 +424,8 @@ class NostalgiKitHub:
         start_btn = tk.Button(select_start_frame,
                              text="START",
                              font=self.fonts['retro_small'],
-                             bg=self.colors['button_gray'],
-                             fg=self.colors['text_dark'],
+                             bg=self.colors.button_gray,
+                             fg=self.colors.text_dark,
                              relief='raised',
                              bd=2,
                              padx=8,
@@ -374,72 +436,36 @@ class NostalgiKitHub:
         
     def setup_keyboard_bindings(self):
         """Setup comprehensive keyboard controls"""
-        # Arrow keys and WASD for D-Pad
-        self.root.bind('<Up>', lambda e: self.dpad_action("UP"))
-        self.root.bind('<Down>', lambda e: self.dpad_action("DOWN"))
-        self.root.bind('<Left>', lambda e: self.dpad_action("LEFT"))
-        self.root.bind('<Right>', lambda e: self.dpad_action("RIGHT"))
-        self.root.bind('<w>', lambda e: self.dpad_action("UP"))
-        self.root.bind('<s>', lambda e: self.dpad_action("DOWN"))
-        self.root.bind('<a>', lambda e: self.dpad_action("LEFT"))
-        self.root.bind('<d>', lambda e: self.dpad_action("RIGHT"))
-        
-        # Action buttons
-        self.root.bind('<Return>', lambda e: self.x_button_action())  # Enter = X button
-        self.root.bind('<space>', lambda e: self.x_button_action())   # Space = X button
-        self.root.bind('<x>', lambda e: self.x_button_action())       # X = X button
-        self.root.bind('<Escape>', lambda e: self.y_button_action())  # Escape = Y button
-        self.root.bind('<BackSpace>', lambda e: self.y_button_action()) # Backspace = Y button
-        self.root.bind('<y>', lambda e: self.y_button_action())       # Y = Y button
-        
-        # SELECT and START
-        self.root.bind('<Tab>', lambda e: self.select_action())       # Tab = SELECT
-        
-        # Ensure focus
-        self.root.bind('<Button-1>', lambda e: self.root.focus_set())
+        # Drop any bindings still in place so their Tcl commands are freed
+        self.remove_keyboard_bindings()
+        for sequence, action, arg in self._KEY_BINDINGS:
+            funcid = self.root.bind(sequence, lambda e, a=action, v=arg: self.on_bound_key(a, v))
+            self._key_funcids.append((sequence, funcid))
         
         # Key press event handler
-        self.root.bind('<Key>', self.on_key_press)
+        self._key_funcids.append(('<Key>', self.root.bind('<Key>', self.on_key_press)))
+    
+    def on_bound_key(self, action, arg):
+        """Shared handler for the hub's D-Pad and button key bindings"""
+        if action == 'dpad':
+            self.dpad_action(arg)
+        elif action == 'x':
+            self.x_button_action()
+        elif action == 'y':
+            self.y_button_action()
+        elif action == 'select':
+            self.select_action()
     
     def remove_keyboard_bindings(self):
         """Remove keyboard bindings when game is running"""
-        # Unbind D-Pad keys
-        self.root.unbind('<Up>')
-        self.root.unbind('<Down>')
-        self.root.unbind('<Left>')
-        self.root.unbind('<Right>')
-        self.root.unbind('<w>')
-        self.root.unbind('<s>')
-        self.root.unbind('<a>')
-        self.root.unbind('<d>')
-        
-        # Unbind action buttons (games will handle these)
-        self.root.unbind('<Return>')
-        self.root.unbind('<space>')
-        self.root.unbind('<x>')
-        self.root.unbind('<Escape>')
-        self.root.unbind('<BackSpace>')
-        self.root.unbind('<y>')
-        
-        # Unbind SELECT and START
-        self.root.unbind('<Tab>')
-        
-        # Keep Button-1 and Key bindings for focus management
+        # Games handle every key themselves, and bind <Key> on the root too
+        for sequence, funcid in self._key_funcids:
+            self.root.unbind(sequence, funcid)
+        self._key_funcids = []
         
     def get_active_game_instance(self):
         """Return the currently active game object if a game is running"""
-        screen_to_key = {
-            'card_game': 'card_game',
-            'war_game': 'war_game',
-            'river_game': 'river_game',
-            'galaxy_war': 'galaxy_war',
-            'crakers_game': 'crakers_game',
-            'tetris_game': 'tetris_game'
-        }
-        game_key = screen_to_key.get(self.current_screen)
-        if game_key:
-            return self.game_instances.get(game_key)
-        return None
+        return self._active_game
 
     def simulate_keypress_to_game(self, game, keysym, release_delay=120):
         """Forward a lightweight keypress event to the active game"""
@@ -447,23 +473,23 @@ class NostalgiKitHub:
             return False
         if hasattr(game, 'on_key_press'):
             try:
-                event = type('Event', (), {'keysym': keysym, 'char': ''})()
+                event = SyntheticKeyEvent(keysym)
                 game.on_key_press(event)
                 if hasattr(game, 'on_key_release'):
                     self.root.after(release_delay, lambda: self.safe_key_release(game, keysym))
                 return True
             except Exception as e:
-                print(f"Forward keypress failed: {e}")
+                log.warning("Forward keypress failed: %s", e)
         return False
 
     def safe_key_release(self, game, keysym):
         """Safely forward a key release event if the game supports it"""
         try:
             if hasattr(game, 'on_key_release'):
-                event = type('Event', (), {'keysym': keysym, 'char': ''})()
+                event = SyntheticKeyEvent(keysym)
                 game.on_key_release(event)
         except Exception as e:
-            print(f"Forward key release failed: {e}")
+            log.warning("Forward key release failed: %s", e)
 
     def safe_stop_move(self, game, method_name):
         """Call a movement stop method on a game if present"""
@@ -471,7 +497,95 @@ class NostalgiKitHub:
             if hasattr(game, method_name):
                 getattr(game, method_name)(False)
         except Exception as e:
-            print(f"Forward stop move failed: {e}")
+            log.warning("Forward stop move failed: %s", e)
+
+    def get_game_dispatch(self, game):
+        """Return the cached button handlers for the active game"""
+        dispatch = self.game_dispatch.get(self.current_screen)
+        if dispatch is None or dispatch['game'] is not game:
+            dispatch = self.build_game_dispatch(game)
+            self.game_dispatch[self.current_screen] = dispatch
+        return dispatch
+
+    def build_game_dispatch(self, game):
+        """Resolve which game method handles each hub button, once per game"""
+        dispatch = {'game': game}
+
+        has_start_screen = hasattr(game, 'start_game_from_screen') and hasattr(game, 'game_active')
+
+        # X button
+        if hasattr(game, 'x_button_action'):
+            dispatch['x'] = game.x_button_action
+        else:
+            shoot = getattr(game, 'shoot', None)
+
+            def x_action():
+                if has_start_screen and not getattr(game, 'game_active', False):
+                    game.start_game_from_screen()
+                elif shoot:
+                    shoot()
+                else:
+                    self.simulate_keypress_to_game(game, 'Return')
+            dispatch['x'] = x_action
+
+        # Y button
+        for name in ('y_button_action', 'quit_game', 'exit_to_hub'):
+            if hasattr(game, name):
+                dispatch['y'] = getattr(game, name)
+                break
+        else:
+            dispatch['y'] = lambda: self.simulate_keypress_to_game(game, 'Escape')
+
+        # SELECT: leave the game (None lets the hub force its own UI back)
+        dispatch['select'] = getattr(game, 'exit_to_hub', None) or getattr(game, 'quit_game', None)
+
+        # START
+        if hasattr(game, 'toggle_pause'):
+            start_fallback = game.toggle_pause
+        elif hasattr(game, 'start_game'):
+            start_fallback = game.start_game
+        else:
+            start_fallback = lambda: self.simulate_keypress_to_game(game, 'Return')
+        if has_start_screen:
+            def start_action():
+                if not getattr(game, 'game_active', False):
+                    game.start_game_from_screen()
+                else:
+                    start_fallback()
+            dispatch['start'] = start_action
+        else:
+            dispatch['start'] = start_fallback
+
+        # D-Pad
+        key_map = {"UP": "Up", "DOWN": "Down", "LEFT": "Left", "RIGHT": "Right"}
+        can_move = hasattr(game, 'set_move_left') or hasattr(game, 'set_move_right')
+        for direction, keysym in key_map.items():
+            method_name = f"dpad_{direction.lower()}"
+            if hasattr(game, method_name):
+                handler = getattr(game, method_name)
+            elif hasattr(game, 'dpad_pressed'):
+                # Crakers uses dpad_pressed(direction)
+                handler = lambda d=direction: game.dpad_pressed(d)
+            elif direction in ("LEFT", "RIGHT") and can_move:
+                # Galaxy War & similar movement helpers
+                handler = lambda d=direction: self.nudge_game_movement(game, d)
+            else:
+                handler = lambda k=keysym: self.simulate_keypress_to_game(game, k)
+            dispatch[direction] = handler
+        return dispatch
+
+    def nudge_game_movement(self, game, direction):
+        """Briefly move left/right in games that expose set_move_* helpers"""
+        if direction == "LEFT":
+            if hasattr(game, 'set_move_right'):
+                game.set_move_right(False)
+            game.set_move_left(True)
+            self.root.after(150, lambda: self.safe_stop_move(game, 'set_move_left'))
+        else:
+            if hasattr(game, 'set_move_left'):
+                game.set_move_left(False)
+            game.set_move_right(True)
+            self.root.after(150, lambda: self.safe_stop_move(game, 'set_move_right'))
 
     def forward_action_to_game(self, button):
         """Route X/Y button presses to the active game"""
@@ -479,182 +593,103 @@ class NostalgiKitHub:
         if not game:
             return False
         try:
-            if button == 'x':
-                if hasattr(game, 'x_button_action'):
-                    game.x_button_action()
-                    return True
-                if hasattr(game, 'start_game_from_screen') and hasattr(game, 'game_active'):
-                    if not getattr(game, 'game_active', False):
-                        game.start_game_from_screen()
-                        return True
-                if hasattr(game, 'shoot'):
-                    game.shoot()
-                    return True
-                return self.simulate_keypress_to_game(game, 'Return')
-            if button == 'y':
-                if hasattr(game, 'y_button_action'):
-                    game.y_button_action()
-                    return True
-                if hasattr(game, 'quit_game'):
-                    game.quit_game()
-                    return True
-                if hasattr(game, 'exit_to_hub'):
-                    game.exit_to_hub()
-                    return True
-                return self.simulate_keypress_to_game(game, 'Escape')
+            self.get_game_dispatch(game)[button]()
+            return True
         except Exception as e:
-            print(f"Forward button failed: {e}")
+            log.warning("Forward button failed: %s", e)
         return False
         
     def get_battery_display(self):
         """Generate battery display text"""
-        filled_blocks = '▓' * self.battery_level
-        empty_blocks = '▒' * (4 - self.battery_level)
-        return f"BATTERY {filled_blocks}{empty_blocks}"
+        return self._BATTERY_STRINGS[max(0, min(4, self.battery_level))]
     
+    @property
+    def gamepad_polling_active(self):
+        """True while the hub (not a game) owns gamepad input"""
+        return self._gamepad_active
+
+    @gamepad_polling_active.setter
+    def gamepad_polling_active(self, active):
+        # (Un)subscribes the hub from the shared gamepad poller
+        poller = self._gamepad_poller
+        if poller is not None:
+            if active and not self._gamepad_active:
+                poller.subscribe(self.root, self.on_gamepad_button, self.on_gamepad_hat)
+            elif not active and self._gamepad_active:
+                poller.unsubscribe(self.on_gamepad_button)
+        self._gamepad_active = active
+
     def init_gamepad(self):
         """Initialize pygame gamepad support"""
         try:
-            pygame.init()
-            pygame.joystick.init()
-            
-            # Gamepad state
-            self.joystick = None
+            # The poller's thread is the only reader of SDL's event queue;
+            # the hub and the games take turns subscribing to it
+            from gamepad_poller import poller
+            poller.start()
+            self._gamepad_poller = poller
             self.gamepad_enabled = True
             
-            # Button mapping (XInput standard)
-            self.BTN_A = 0      # A button (OK/Confirm)
-            self.BTN_B = 1      # B button (Back)
-            self.BTN_X = 2      # X button
-            self.BTN_Y = 3      # Y button
-            self.BTN_LB = 4     # Left bumper
-            self.BTN_RB = 5     # Right bumper
-            self.BTN_BACK = 6   # Back/Select button
-            self.BTN_START = 7  # Start button
-            
-            # State tracking for edge-trigger (prevent spam)
-            self.last_button_state = {}
-            self.last_hat = (0, 0)
-            self.gamepad_polling_active = False
-            
-            # Try to connect gamepad
-            self.ensure_gamepad()
+            # Start listening unless a game has already taken over
+            if self.current_screen in ("blank", "welcome", "menu"):
+                self.gamepad_polling_active = True
             
         except Exception as e:
-            print(f"Gamepad initialization failed: {e}")
+            log.warning("Gamepad initialization failed: %s", e)
             self.gamepad_enabled = False
     
-    def ensure_gamepad(self):
-        """Check and connect gamepad if available"""
-        if not self.gamepad_enabled:
-            return None
-            
+    def on_gamepad_button(self, button):
+        """Trigger hub actions for a gamepad button (runs on the Tk thread)"""
+        # A game may have started since this press was queued
+        if not self.gamepad_polling_active:
+            return
+        if self.current_screen not in ("menu", "welcome"):
+            return
         try:
-            pygame.joystick.quit()
-            pygame.joystick.init()
-            
-            if pygame.joystick.get_count() > 0:
-                self.joystick = pygame.joystick.Joystick(0)
-                self.joystick.init()
-                print(f"Gamepad connected: {self.joystick.get_name()}")
-                return self.joystick
-            else:
-                self.joystick = None
-                return None
+            if button == BTN_START:
+                self.start_action()
+            elif button == BTN_BACK:
+                self.select_action()
+            elif button in (BTN_A, BTN_X):
+                self.x_button_action()
+            elif button in (BTN_B, BTN_Y):
+                self.y_button_action()
         except Exception as e:
-            print(f"Gamepad connection error: {e}")
-            self.joystick = None
-            return None
+            log.warning("Gamepad event error: %s", e)
     
-    def poll_gamepad(self):
-        """Poll gamepad input and trigger actions"""
-        if not self.gamepad_enabled or not self.gamepad_polling_active:
+    def on_gamepad_hat(self, value):
+        """Move the menu selection with the D-Pad (runs on the Tk thread)"""
+        # Only handle D-Pad in menu, not during games
+        if not self.gamepad_polling_active or self.current_screen != "menu":
             return
-        
-        # Check if window still exists
         try:
-            self.root.winfo_exists()
-        except:
-            return
-        
-        # Check for gamepad connection (hot-plug support)
-        if self.joystick is None or not self.joystick.get_init():
-            self.ensure_gamepad()
-        
-        try:
-            pygame.event.pump()  # Update events
-            
-            if self.joystick is not None:
-                # --- Button Handling (with edge-trigger) ---
-                def is_pressed(btn_index):
-                    try:
-                        return self.joystick.get_button(btn_index) == 1
-                    except pygame.error:
-                        return False
-                
-                def button_just_pressed(btn_index):
-                    """Check if button was just pressed (edge-trigger)"""
-                    current = is_pressed(btn_index)
-                    previous = self.last_button_state.get(btn_index, False)
-                    self.last_button_state[btn_index] = current
-                    return current and not previous
-                
-                # Map buttons to actions (menu and welcome)
-                if self.current_screen in ("menu", "welcome"):
-                    if button_just_pressed(self.BTN_START):
-                        self.start_action()
-                    if button_just_pressed(self.BTN_BACK):
-                        self.select_action()
-                    if button_just_pressed(self.BTN_A) or button_just_pressed(self.BTN_X):
-                        self.x_button_action()
-                    if button_just_pressed(self.BTN_B) or button_just_pressed(self.BTN_Y):
-                        self.y_button_action()
-                
-                # --- D-Pad (Hat) Handling ---
-                try:
-                    hat = self.joystick.get_hat(0)  # (x, y)
-                except pygame.error:
-                    hat = (0, 0)
-                
-                # Trigger only on state change (edge-trigger)
-                # Only handle D-Pad in menu, not during games
-                if self.current_screen == "menu" and hat != self.last_hat:
-                    if hat == (0, 1):      # UP
-                        self.dpad_action("UP")
-                    elif hat == (0, -1):   # DOWN
-                        self.dpad_action("DOWN")
-                    elif hat == (-1, 0):   # LEFT
-                        self.dpad_action("LEFT")
-                    elif hat == (1, 0):    # RIGHT
-                        self.dpad_action("RIGHT")
-                    self.last_hat = hat
-                elif self.current_screen != "menu":
-                    # Update last_hat even in games to prevent stuck states
-                    self.last_hat = hat
-        
+            if value == (0, 1):      # UP
+                self.dpad_action("UP")
+            elif value == (0, -1):   # DOWN
+                self.dpad_action("DOWN")
+            elif value == (-1, 0):   # LEFT
+                self.dpad_action("LEFT")
+            elif value == (1, 0):    # RIGHT
+                self.dpad_action("RIGHT")
         except Exception as e:
-            print(f"Gamepad polling error: {e}")
-        
-        # Poll every 30ms (~33 FPS)
-        self.root.after(30, self.poll_gamepad)
+            log.warning("Gamepad event error: %s", e)
     
     def on_key_press(self, event):
         """Handle key press events"""
         key = event.keysym.lower()
-        print(f"Key pressed: {key}")
+        log.debug("Key pressed: %s", key)
         
     def dpad_action(self, direction):
         """Handle D-Pad direction actions"""
         if self.current_screen == "menu":
-            print(f"D-Pad pressed: {direction}")
+            log.debug("D-Pad pressed: %s", direction)
             if direction == "UP":
                 self.selected_game = (self.selected_game - 1) % len(self.games)
-                self.show_main_menu()
-                print(f"Menu selection: {self.selected_game}")
+                self.schedule_menu_redraw()
+                log.debug("Menu selection: %s", self.selected_game)
             elif direction == "DOWN":
                 self.selected_game = (self.selected_game + 1) % len(self.games)
-                self.show_main_menu()
-                print(f"Menu selection: {self.selected_game}")
+                self.schedule_menu_redraw()
+                log.debug("Menu selection: %s", self.selected_game)
             return
 
         # Forward to active game when not in menu
@@ -662,65 +697,42 @@ class NostalgiKitHub:
         if not game:
             return
 
-        method_name = f"dpad_{direction.lower()}"
-        if hasattr(game, method_name):
-            try:
-                getattr(game, method_name)()
-                return
-            except Exception as e:
-                print(f"Forward D-Pad to game failed: {e}")
+        try:
+            self.get_game_dispatch(game)[direction]()
+        except Exception as e:
+            log.warning("Forward D-Pad to game failed: %s", e)
+                
+    def schedule_menu_redraw(self):
+        """Redraw the menu once per idle pass, however many presses queued up"""
+        if not self._menu_redraw_pending:
+            self._menu_redraw_pending = True
+            self.root.after_idle(self.flush_menu_redraw)
 
-        # Crakers uses dpad_pressed(direction)
-        if hasattr(game, 'dpad_pressed'):
-            try:
-                game.dpad_pressed(direction)
-                return
-            except Exception as e:
-                print(f"Forward D-Pad pressed to game failed: {e}")
+    def flush_menu_redraw(self):
+        """Show the latest menu selection"""
+        self._menu_redraw_pending = False
+        if self.current_screen == "menu":
+            self.update_menu_selection()
 
-        # Galaxy War & similar movement helpers
-        if direction in ("LEFT", "RIGHT") and (hasattr(game, 'set_move_left') or hasattr(game, 'set_move_right')):
-            if direction == "LEFT":
-                try:
-                    if hasattr(game, 'set_move_right'):
-                        game.set_move_right(False)
-                    game.set_move_left(True)
-                    self.root.after(150, lambda: self.safe_stop_move(game, 'set_move_left'))
-                except Exception as e:
-                    print(f"Forward LEFT failed: {e}")
-            else:
-                try:
-                    if hasattr(game, 'set_move_left'):
-                        game.set_move_left(False)
-                    game.set_move_right(True)
-                    self.root.after(150, lambda: self.safe_stop_move(game, 'set_move_right'))
-                except Exception as e:
-                    print(f"Forward RIGHT failed: {e}")
-            return
+    def is_bounce(self, button):
+        """True if this button already fired within the debounce window"""
+        now = time.monotonic()
+        if now - self._last_action_ts.get(button, 0.0) < self._ACTION_DEBOUNCE_S:
+            return True
+        self._last_action_ts[button] = now
+        return False
 
-        key_map = {"UP": "Up", "DOWN": "Down", "LEFT": "Left", "RIGHT": "Right"}
-        self.simulate_keypress_to_game(game, key_map.get(direction, ''))
-                
     def x_button_action(self):
         """Handle X button press"""
-        print(f"X button pressed, screen: {self.current_screen}")
+        if self.is_bounce('x'):
+            return
+        log.debug("X button pressed, screen: %s", self.current_screen)
         
         if self.current_screen == "welcome":
             self.show_main_menu()
         elif self.current_screen == "menu":
-            print(f"Selected index: {self.selected_game}")
-            if self.selected_game == 0:
-                self.start_card_game()
-            elif self.selected_game == 1:
-                self.start_war_game()
-            elif self.selected_game == 2:
-                self.start_river_game()
-            elif self.selected_game == 3:
-                self.start_galaxy_war_game()
-            elif self.selected_game == 4:
-                self.start_crakers_game()
-            elif self.selected_game == 5:
-                self.start_tetris_game()
+            log.debug("Selected index: %s", self.selected_game)
+            self.start_game(*self._GAME_SPECS[self.selected_game])
         else:
             self.forward_action_to_game('x')
 
@@ -730,6 +742,8 @@ class NostalgiKitHub:
                 
     def y_button_action(self):
         """Handle Y button press"""
+        if self.is_bounce('y'):
+            return
         if self.current_screen == "menu":
             self.show_welcome_screen()
         elif self.current_screen == "welcome":
@@ -739,6 +753,8 @@ class NostalgiKitHub:
             
     def select_action(self):
         """Handle SELECT button press"""
+        if self.is_bounce('select'):
+            return
         # Return to hub menu from any state
         if self.current_screen == "welcome":
             self.show_main_menu()
@@ -747,22 +763,21 @@ class NostalgiKitHub:
             return
 
         game = self.get_active_game_instance()
-        if game:
+        exit_game = self.get_game_dispatch(game)['select'] if game else None
+        if exit_game is not None:
             try:
-                if hasattr(game, 'exit_to_hub'):
-                    game.exit_to_hub()
-                    return
-                if hasattr(game, 'quit_game'):
-                    game.quit_game()
-                    return
+                exit_game()
+                return
             except Exception as e:
-                print(f"Select exit to hub failed: {e}")
+                log.warning("Select exit to hub failed: %s", e)
 
         # Fallback: force hub UI
         self.return_to_nostalgik()
         
     def start_action(self):
         """Handle START button press"""
+        if self.is_bounce('start'):
+            return
         if self.current_screen == "welcome":
             self.show_main_menu()
         elif self.current_screen == "menu":
@@ -771,24 +786,12 @@ class NostalgiKitHub:
             game = self.get_active_game_instance()
             if not game:
                 return
+            # Start screen, pause toggle, generic start or Return key
+            start_game = self.get_game_dispatch(game)['start']
             try:
-                # If game inactive and has start screen
-                if hasattr(game, 'game_active') and hasattr(game, 'start_game_from_screen'):
-                    if not getattr(game, 'game_active', False):
-                        game.start_game_from_screen()
-                        return
-                # Pause toggle if available
-                if hasattr(game, 'toggle_pause'):
-                    game.toggle_pause()
-                    return
-                # Generic start
-                if hasattr(game, 'start_game'):
-                    game.start_game()
-                    return
-                # Fallback to Return key simulation
-                self.simulate_keypress_to_game(game, 'Return')
+                start_game()
             except Exception as e:
-                print(f"Start action forward failed: {e}")
+                log.warning("Start action forward failed: %s", e)
             
     def show_blank_screen(self):
         """Show blank screen on startup"""
@@ -796,23 +799,24 @@ class NostalgiKitHub:
         self.current_screen = "blank"
         
         # Just empty screen
-        blank_frame = tk.Frame(self.screen, bg=self.colors['screen_green'])
-        blank_frame.pack(fill='both', expand=True)
+        self.screen_frame('blank', self.colors.screen_green, fill='both', expand=True)
     
     def show_welcome_screen(self):
         """Show NostalgiKit welcome screen"""
         self.clear_screen()
         self.current_screen = "welcome"
         
-        content = tk.Frame(self.screen, bg=self.colors['screen_green'])
-        content.pack(fill='both', expand=True, padx=10, pady=10)
+        content, created = self.screen_frame('welcome', self.colors.screen_green,
+                                             fill='both', expand=True, padx=10, pady=10)
+        if not created:
+            return
         
         # Welcome message
         welcome_label = tk.Label(content,
                                 text="NostalgiKIT\nCLASSIC",
                                 font=self.fonts['retro_large'],
-                                fg=self.colors['screen_dark'],
-                                bg=self.colors['screen_green'],
+                                fg=self.colors.screen_dark,
+                                bg=self.colors.screen_green,
                                 justify='center')
         welcome_label.pack(expand=True)
         
@@ -820,16 +824,16 @@ class NostalgiKitHub:
         logo_label = tk.Label(content,
                              text="🎮",
                              font=self.fonts['retro_large'],
-                             fg=self.colors['screen_dark'],
-                             bg=self.colors['screen_green'])
+                             fg=self.colors.screen_dark,
+                             bg=self.colors.screen_green)
         logo_label.pack()
         
         # Instructions
         instruction_label = tk.Label(content,
                                     text="Press START\nor X to begin",
                                     font=self.fonts['retro_small'],
-                                    fg=self.colors['screen_dark'],
-                                    bg=self.colors['screen_green'],
+                                    fg=self.colors.screen_dark,
+                                    bg=self.colors.screen_green,
                                     justify='center')
         instruction_label.pack(side='bottom', pady=10)
         
@@ -838,247 +842,191 @@ class NostalgiKitHub:
         self.clear_screen()
         self.current_screen = "menu"
         
-        content = tk.Frame(self.screen, bg=self.colors['screen_green'])
-        content.pack(fill='both', expand=True, padx=5, pady=5)
+        content, created = self.screen_frame('menu', self.colors.screen_green,
+                                             fill='both', expand=True, padx=5, pady=5)
+        if not created:
+            self.update_menu_selection()
+            return
+        
+        green = self.colors.screen_green
+        dark = self.colors.screen_dark
+        font_small = self.fonts['retro_small']
+        font_tiny = self.fonts['retro_tiny']
         
         # Title
         title_label = tk.Label(content,
                               text="SELECT GAME",
                               font=self.fonts['retro_text'],
-                              fg=self.colors['screen_dark'],
-                              bg=self.colors['screen_green'])
+                              fg=dark,
+                              bg=green)
         title_label.pack(pady=(5, 10))
         
-        # Game list
-        for i, game in enumerate(self.games):
-            if i == self.selected_game:
-                # Selected game
-                game_frame = tk.Frame(content, bg=self.colors['screen_dark'], relief='raised', bd=1)
-                game_frame.pack(fill='x', padx=10, pady=2)
-                
-                game_label = tk.Label(game_frame,
-                                     text=f"► {game['name']}",
-                                     font=self.fonts['retro_small'],
-                                     fg=self.colors['screen_green'],
-                                     bg=self.colors['screen_dark'],
-                                     anchor='w')
-                game_label.pack(fill='x', padx=5, pady=2)
-                
-                desc_label = tk.Label(game_frame,
-                                     text=f"  {game['desc']}",
-                                     font=self.fonts['retro_tiny'],
-                                     fg=self.colors['screen_green'],
-                                     bg=self.colors['screen_dark'],
-                                     anchor='w')
-                desc_label.pack(fill='x', padx=5)
-            else:
-                # Unselected game
-                game_label = tk.Label(content,
-                                     text=f"  {game['name']}",
-                                     font=self.fonts['retro_small'],
-                                     fg=self.colors['screen_dark'],
-                                     bg=self.colors['screen_green'],
-                                     anchor='w')
-                game_label.pack(fill='x', padx=10, pady=1)
+        # Game list - rows are built once, selection changes only restyle them.
+        # Rows start unselected; shared option dicts keep the loop body small
+        row_opts = {'bg': green, 'relief': 'flat', 'bd': 0}
+        name_opts = {'font': font_small, 'fg': dark, 'bg': green, 'anchor': 'w'}
+        desc_opts = {'font': font_tiny, 'fg': green, 'bg': dark, 'anchor': 'w'}
+        self._menu_rows = []
+        for game in self.games:
+            game_frame = tk.Frame(content, **row_opts)
+            game_frame.pack(fill='x', padx=10, pady=1)
+            
+            name_text = tk.StringVar(self.root, value=f"  {game['name']}")
+            game_label = tk.Label(game_frame, textvariable=name_text, **name_opts)
+            game_label.pack(fill='x')
+            
+            desc_label = tk.Label(game_frame, text=f"  {game['desc']}", **desc_opts)
+            # Tk path names, used to restyle rows with direct Tcl calls
+            self._menu_rows.append((str(game_frame), str(game_label), str(desc_label), name_text))
+        self._menu_selected_row = None
+        self.update_menu_selection()
                 
         # Controls info
-        controls_frame = tk.Frame(content, bg=self.colors['screen_green'])
+        controls_frame = tk.Frame(content, bg=green)
         controls_frame.pack(side='bottom', fill='x', pady=5)
         
         controls_label = tk.Label(controls_frame,
                                  text="↑↓: Select  X: Play  Y: Back",
-                                 font=self.fonts['retro_tiny'],
-                                 fg=self.colors['screen_dark'],
-                                 bg=self.colors['screen_green'])
+                                 font=font_tiny,
+                                 fg=dark,
+                                 bg=green)
         controls_label.pack()
         
+    def update_menu_selection(self):
+        """Highlight the selected game row in the menu"""
+        previous = self._menu_selected_row
+        if not self._menu_rows or previous == self.selected_game:
+            return
+        # Only the old and new rows change; configure them through Tcl directly
+        tk_call = self.root.tk.call
+        if previous is not None:
+            self.style_menu_row(tk_call, previous, False)
+        self.style_menu_row(tk_call, self.selected_game, True)
+        self._menu_selected_row = self.selected_game
+        
+    def style_menu_row(self, tk_call, index, selected):
+        """Apply the selected/unselected look to one menu row"""
+        frame_path, label_path, desc_path, name_text = self._menu_rows[index]
+        name = self.games[index]['name']
+        dark = self.colors.screen_dark
+        green = self.colors.screen_green
+        if selected:
+            tk_call(frame_path, 'configure', '-bg', dark, '-relief', 'raised', '-bd', 1)
+            tk_call('pack', 'configure', frame_path, '-pady', 2)
+            name_text.set(f"► {name}")
+            tk_call(label_path, 'configure', '-fg', green, '-bg', dark)
+            tk_call('pack', 'configure', label_path, '-padx', 5, '-pady', 2)
+            tk_call('pack', 'configure', desc_path, '-fill', 'x', '-padx', 5)
+        else:
+            tk_call(frame_path, 'configure', '-bg', green, '-relief', 'flat', '-bd', 0)
+            tk_call('pack', 'configure', frame_path, '-pady', 1)
+            name_text.set(f"  {name}")
+            tk_call(label_path, 'configure', '-fg', dark, '-bg', green)
+            tk_call('pack', 'configure', label_path, '-padx', 0, '-pady', 0)
+            tk_call('pack', 'forget', desc_path)
+        
     def power_off(self):
         """Simulate power off"""
         self.clear_screen()
         
-        off_frame = tk.Frame(self.screen, bg=self.colors['screen_dark'])
-        off_frame.pack(fill='both', expand=True)
+        self.screen_frame('off', self.colors.screen_dark, fill='both', expand=True)
         
         self.current_screen = "off"
         
     def clear_screen(self):
         """Clear the NostalgiKit screen"""
+        cached_frames = set(self._screens.values())
+        hidden = []
         for widget in self.screen.winfo_children():
-            widget.destroy()
+            if widget in cached_frames:
+                hidden.append(str(widget))  # Hub screens are kept for reuse
+            else:
+                # Game widgets go through tkinter's destroy so their Python
+                # callbacks are unregistered along with the Tcl widgets
+                widget.destroy()
+        if hidden:
+            # Unpack all cached hub screens with a single Tcl command
+            self.screen.tk.call('pack', 'forget', *hidden)
+    
+    def screen_frame(self, name, bg, **pack_options):
+        """Pack the cached frame for a hub screen, creating it on first use"""
+        frame = self._screens.get(name)
+        created = frame is None
+        if created:
+            frame = tk.Frame(self.screen, bg=bg)
+            self._screens[name] = frame
+        frame.pack(**pack_options)
+        return frame, created
             
     def show_loading_screen(self, game_name):
         """Show loading screen for games"""
         self.clear_screen()
-        loading_frame = tk.Frame(self.screen, bg=self.colors['screen_green'])
-        loading_frame.pack(fill='both', expand=True)
-        
-        loading_label = tk.Label(loading_frame,
-                                text=f"LOADING...\n{game_name}\n\nPress Y to return",
-                                font=self.fonts['retro_text'],
-                                fg=self.colors['screen_dark'],
-                                bg=self.colors['screen_green'],
-                                justify='center')
-        loading_label.pack(expand=True)
-        
-    def start_card_game(self):
-        """Start the Card Guess Game"""
-        # Stop gamepad polling while game is running
-        self.gamepad_polling_active = False
-        print("Starting Number Oracle (card game)...")
-        
-        # Show loading screen
-        self.show_loading_screen("NUMBER ORACLE")
-        
-        # Launch actual game after brief delay
-        def launch_game():
-            try:
-                print("Launching Number Oracle now...")
-                # Remove hub keyboard bindings so game can handle input
-                self.remove_keyboard_bindings()
-                # Ekranı temizle
-                self.clear_screen()
-                # Oyun instance yoksa oluştur, varsa tekrar kullan
-                if self.game_instances['card_game'] is None:
-                    self.game_instances['card_game'] = CardGuessGame(self.screen, self.return_to_nostalgik)
-                else:
-                    # Mevcut oyunu göster ve resetle
-                    self.game_instances['card_game'].show()
-                # Track current screen to avoid menu handlers during game
-                self.current_screen = "card_game"
-            except Exception as e:
-                print(f"Failed to launch card game: {e}")
-                try:
-                    messagebox.showerror("Card Game Error", str(e))
-                except Exception:
-                    pass
-                # Return to menu so user isn't stuck
-                self.show_main_menu()
-                self.current_screen = "menu"
-                # Resume gamepad polling for hub
-                self.gamepad_polling_active = True
-        
-        # Shorter delay so it feels instant
-        self.root.after(300, launch_game)
-        
-    def start_war_game(self):
-        """Start the War Game"""
-        # Stop gamepad polling while game is running
-        self.gamepad_polling_active = False
-        
-        # Show loading screen
-        self.show_loading_screen("WAR GAME")
-        
-        # Launch actual game after brief delay
-        def launch_game():
-            # Remove hub keyboard bindings so game can handle input
-            self.remove_keyboard_bindings()
-            # Ekranı temizle
-            self.clear_screen()
-            # Oyun instance yoksa oluştur, varsa tekrar kullan
-            if self.game_instances['war_game'] is None:
-                self.game_instances['war_game'] = WarGame(self.screen, self.return_to_nostalgik)
-            else:
-                # Mevcut oyunu göster ve resetle
-                self.game_instances['war_game'].show()
-            # Track active screen for input routing
-            self.current_screen = "war_game"
-        
-        self.root.after(1500, launch_game)
-        
-    def start_river_game(self):
-        """Start the River Crossing Game"""
-        # Stop gamepad polling while game is running
-        self.gamepad_polling_active = False
-        
-        # Show loading screen
-        self.show_loading_screen("RIVER PUZZLE")
-        
-        # Launch actual game after brief delay
-        def launch_game():
-            # Remove hub keyboard bindings so game can handle input
-            self.remove_keyboard_bindings()
-            # Ekranı temizle
-            self.clear_screen()
-            # Oyun instance yoksa oluştur, varsa tekrar kullan
-            if self.game_instances['river_game'] is None:
-                self.game_instances['river_game'] = RiverGame(self.screen, self.return_to_nostalgik)
-            else:
-                # Mevcut oyunu göster ve resetle
-                self.game_instances['river_game'].show()
-            # Track active screen for input routing
-            self.current_screen = "river_game"
+        loading_frame, created = self.screen_frame('loading', self.colors.screen_green,
+                                                   fill='both', expand=True)
+        if created:
+            self._loading_text = tk.StringVar(self.root)
+            loading_label = tk.Label(loading_frame,
+                                    textvariable=self._loading_text,
+                                    font=self.fonts['retro_text'],
+                                    fg=self.colors.screen_dark,
+                                    bg=self.colors.screen_green,
+                                    justify='center')
+            loading_label.pack(expand=True)
+        self._loading_text.set(f"LOADING...\n{game_name}\n\nPress Y to return")
         
-        self.root.after(1500, launch_game)
-
-    def start_galaxy_war_game(self):
-        """Start the Galaxy War Pat Game"""
+    def start_game(self, key, title, module_name, class_name):
+        """Show the loading screen, then launch the game once it is drawn"""
         # Stop gamepad polling while game is running
         self.gamepad_polling_active = False
+        log.debug("Starting %s...", title)
         
         # Show loading screen
-        self.show_loading_screen("GALAXY WAR PAT")
-        
-        # Launch actual game after brief delay
-        def launch_game():
-            # Remove hub keyboard bindings so game can handle input
-            self.remove_keyboard_bindings()
-            # Ekranı temizle
-            self.clear_screen()
-            # Oyun instance yoksa oluştur, varsa tekrar kullan
-            if self.game_instances['galaxy_war'] is None:
-                self.game_instances['galaxy_war'] = GalaxyWarPat(self.screen, self.return_to_nostalgik)
-            else:
-                # Mevcut oyunu göster ve resetle
-                self.game_instances['galaxy_war'].show()
-            # Track active screen for input routing
-            self.current_screen = "galaxy_war"
-        
-        self.root.after(1500, launch_game)
-
-    def start_crakers_game(self):
-        """Start the Crakers Quest Game"""
-        # Stop gamepad polling while game is running
-        self.gamepad_polling_active = False
+        self.show_loading_screen(title)
         
-        # Show loading screen
-        self.show_loading_screen("CRAKERS QUEST")
+        # Lay out and draw the loading frame now, then launch from the event
+        # loop; an idle callback would run in the same idle pass and unpack
+        # the freshly mapped frame before it was ever painted
+        self.root.update_idletasks()
+        self.root.after(0, self.launch_game, key, title, module_name, class_name)
         
-        # Launch actual game after brief delay
-        def launch_game():
+    def launch_game(self, key, title, module_name, class_name):
+        """Create or re-show a game instance on the hub screen"""
+        try:
+            log.debug("Launching %s now...", title)
             # Remove hub keyboard bindings so game can handle input
             self.remove_keyboard_bindings()
             # Ekranı temizle
             self.clear_screen()
-            # Oyun instance yoksa oluştur, varsa tekrar kullan
-            if self.game_instances['crakers_game'] is None:
-                self.game_instances['crakers_game'] = CrakersGame(self.screen, self.return_to_nostalgik)
-            else:
-                # Mevcut oyunu göster ve resetle
-                self.game_instances['crakers_game'].show()
+            self._active_game, _ = self.get_or_create_game(key, module_name, class_name)
             # Track active screen for input routing
-            self.current_screen = "crakers_game"
+            self.current_screen = key
+        except Exception as e:
+            log.warning("Failed to launch %s: %s", title, e)
+            try:
+                messagebox.showerror("Game Error", str(e))
+            except Exception:
+                pass
+            # Return to menu so user isn't stuck
+            self.return_to_nostalgik()
+        
+    def get_or_create_game(self, key, module_name, class_name):
+        """Return the game instance for key, creating it on first use"""
+        # Oyun instance yoksa oluştur, varsa tekrar kullan
+        game = self.game_instances.get(key)
+        if game is None:
+            # First launch of this game: import its module now
+            game_class = getattr(importlib.import_module(module_name), class_name)
+            game = game_class(self.screen, self.return_to_nostalgik)
+            self.game_instances[key] = game
+            return game, True
+        # Mevcut oyunu göster ve resetle
+        game.show()
+        return game, False
         
-        self.root.after(1500, launch_game)
-
-    def start_tetris_game(self):
-        """Start the Block Stack (Tetris) Game"""
-        self.gamepad_polling_active = False
-
-        self.show_loading_screen("BLOCK STACK")
-
-        def launch_game():
-            self.remove_keyboard_bindings()
-            self.clear_screen()
-            if self.game_instances['tetris_game'] is None:
-                self.game_instances['tetris_game'] = TetrisGame(self.screen, self.return_to_nostalgik)
-            else:
-                self.game_instances['tetris_game'].show()
-            self.current_screen = "tetris_game"
-
-        self.root.after(1500, launch_game)
-
     def return_to_nostalgik(self):
         """Return to NostalgiKit interface"""
+        self._active_game = None
+        
         # Clear only the screen area (not the entire root)
         self.clear_screen()
         
@@ -1087,17 +1035,20 @@ class NostalgiKitHub:
         
         # Re-enable hub keyboard bindings
         self.setup_keyboard_bindings()
+        # Take keyboard focus back from the game's widgets
+        self.root.focus_set()
         
-        # Restart gamepad polling
+        # Hand gamepad input back to the hub
         if self.gamepad_enabled and not self.gamepad_polling_active:
             self.gamepad_polling_active = True
-            self.root.after(100, self.poll_gamepad)
         
     def run(self):
         """Start the NostalgiKit"""
         self.root.mainloop()
 
 if __name__ == "__main__":
+    if os.environ.get('NOSTALGIKIT_DEBUG') == '1':
+        logging.basicConfig(level=logging.DEBUG)
     # Create and run the NostalgiKit
     NostalgiKIT = NostalgiKitHub()
     NostalgiKIT.run()
@@ -0,0 +1,128 @@
+"""
+NostalgiKit Gamepad Poller
+One shared joystick listener for the games that subscribe to it
+
+Copyright (c) 2026 NostalgiKit Project
+Licensed under MIT License - see LICENSE file for details
+"""
+
+import threading
+import time
+import tkinter as tk
+import pygame
+
+
+class GamepadPoller:
+    """Waits on SDL joystick events in one background thread and hands
+    button presses and hat moves to the subscribers on the Tk thread.
+
+    This thread is the only reader of SDL's event queue: the hub and the
+    games subscribe while they own the gamepad instead of draining it."""
+
+    def __init__(self):
+        self.joystick = None
+        self._subs = []  # (root, on_button, on_hat)
+        self._lock = threading.Lock()
+        self._wake = threading.Event()  # Set while anyone is subscribed
+        self._thread = None
+
+    def start(self):
+        """Initialise pygame's joystick support and the listener thread once"""
+        if self._thread is not None:
+            return
+        if not pygame.get_init():
+            pygame.init()
+        if not pygame.joystick.get_init():
+            pygame.joystick.init()
+
+        # Only joystick traffic needs to reach the SDL event queue (the
+        # filter is process-wide, so this covers every game as well)
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.JOYBUTTONDOWN, pygame.JOYBUTTONUP,
+                                  pygame.JOYHATMOTION, pygame.JOYDEVICEADDED,
+                                  pygame.JOYDEVICEREMOVED])
+
+        if pygame.joystick.get_count() > 0:
+            self.joystick = pygame.joystick.Joystick(0)
+            self.joystick.init()
+
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def subscribe(self, root, on_button, on_hat):
+        """Call on_button(button) / on_hat(value) via root.after for each event"""
+        with self._lock:
+            self._subs.append((root, on_button, on_hat))
+        self._wake.set()
+
+    def unsubscribe(self, on_button):
+        """Stop delivering events to the subscriber registered with on_button"""
+        with self._lock:
+            self._subs = [sub for sub in self._subs if sub[1] != on_button]
+            if not self._subs:
+                self._wake.clear()
+
+    def _run(self):
+        """Listener thread: wait for joystick events and hand them to Tk"""
+        input_types = (pygame.JOYBUTTONDOWN, pygame.JOYHATMOTION)
+        hotplug_types = (pygame.JOYDEVICEADDED, pygame.JOYDEVICEREMOVED)
+        while True:
+            if not self._wake.is_set():
+                # Park while nobody is subscribed (games that read button
+                # state themselves run meanwhile), then drop the input they
+                # left queued; hot-plug notices still update the joystick
+                self._wake.wait()
+                try:
+                    for event in pygame.event.get():
+                        if event.type in hotplug_types:
+                            self._handle_hotplug(event)
+                except pygame.error:
+                    pass
+
+            try:
+                event = pygame.event.wait(200)
+            except pygame.error as e:
+                print(f"Gamepad poll error: {e}")
+                time.sleep(1)
+                continue
+            if event.type in hotplug_types:
+                self._handle_hotplug(event)
+                continue
+            if event.type not in input_types:
+                continue
+
+            # Take everything else already queued in one batch
+            try:
+                events = [event] + pygame.event.get(input_types)
+            except pygame.error:
+                events = [event]
+
+            with self._lock:
+                subs = list(self._subs)
+            for root, on_button, on_hat in subs:
+                try:
+                    # Tk is single-threaded: run the handlers on the main loop
+                    root.after(0, self._dispatch, events, on_button, on_hat)
+                except (RuntimeError, tk.TclError):
+                    self.unsubscribe(on_button)  # Window closed
+
+    def _handle_hotplug(self, event):
+        """Open a newly plugged pad, or forget the one that was unplugged"""
+        if event.type == pygame.JOYDEVICEADDED:
+            if self.joystick is None:
+                self.joystick = pygame.joystick.Joystick(event.device_index)
+                self.joystick.init()
+        elif self.joystick is not None and self.joystick.get_instance_id() == event.instance_id:
+            self.joystick = None
+
+    def _dispatch(self, events, on_button, on_hat):
+        """Deliver a batch of events in arrival order (runs on the Tk thread)"""
+        for event in events:
+            if event.type == pygame.JOYBUTTONDOWN:
+                on_button(event.button)
+            else:
+                on_hat(event.value)
+
+
+# Shared by every game module
+poller = GamepadPoller()
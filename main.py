@@ -11,6 +11,8 @@ import tkinter as tk
 from tkinter import messagebox
 import sys
 import os
+import logging
+import importlib.util
 
 # Add current directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -18,8 +20,27 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 def set_window_icon(window):
     """Set the application icon for a window"""
     try:
+        # Windows can use the ICO shipped with the project directly - no PIL needed
+        shipped_ico_path = os.path.join(os.path.dirname(__file__), 'nostalgikit_icon.ico')
+        if sys.platform == 'win32' and os.path.exists(shipped_ico_path):
+            window.iconbitmap(default=shipped_ico_path)
+            return
+
         icon_path = os.path.join(os.path.dirname(__file__), 'icon.png')
         if os.path.exists(icon_path):
+            # Taskbar ICO generated from this version of icon.png on an earlier run
+            import tempfile
+            ico_path = os.path.join(tempfile.gettempdir(),
+                                    f'nostalgikit_icon_{int(os.path.getmtime(icon_path))}.ico')
+            if os.path.exists(ico_path):
+                icon = tk.PhotoImage(file=icon_path)
+                window.iconphoto(False, icon)
+                try:
+                    window.iconbitmap(default=ico_path)
+                except Exception:
+                    pass
+                return
+
             # Try with PIL first for better compatibility
             try:
                 from PIL import Image, ImageTk
@@ -32,8 +53,6 @@ def set_window_icon(window):
 
                 # Also set taskbar icon on Windows by generating a temporary ICO
                 try:
-                    import tempfile
-                    ico_path = os.path.join(tempfile.gettempdir(), 'nostalgikit_icon.ico')
                     pil_image.save(ico_path, format='ICO')
                     window.iconbitmap(default=ico_path)
                 except Exception:
@@ -49,20 +68,12 @@ def check_dependencies():
     """Check if required packages are available"""
     missing_packages = []
     
-    try:
-        import tkinter
-    except ImportError:
-        missing_packages.append("tkinter")
-    
-    try:
-        from PIL import Image, ImageTk
-    except ImportError:
-        missing_packages.append("Pillow")
-
-    try:
-        import pygame
-    except ImportError:
-        missing_packages.append("pygame")
+    # find_spec only locates the packages; game_hub does the real imports later
+    for module_name, package_name in (("tkinter", "tkinter"),
+                                      ("PIL", "Pillow"),
+                                      ("pygame", "pygame")):
+        if importlib.util.find_spec(module_name) is None:
+            missing_packages.append(package_name)
     
     if missing_packages:
         root = tk.Tk()
@@ -80,6 +91,10 @@ def check_dependencies():
 
 def main():
     """Main entry point"""
+    # Set NOSTALGIKIT_DEBUG=1 to trace key presses and menu navigation
+    if os.environ.get('NOSTALGIKIT_DEBUG') == '1':
+        logging.basicConfig(level=logging.DEBUG)
+    
     try:
         # Check dependencies first
         if not check_dependencies():
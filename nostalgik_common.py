@@ -0,0 +1,54 @@
+"""
+NostalgiKit Common
+Helpers shared by the hub and the game modules
+
+Copyright (c) 2026 NostalgiKit Project
+Licensed under MIT License - see LICENSE file for details
+"""
+
+import tkinter.font as tkFont
+import weakref
+
+
+# NostalgiKit font set: name -> (family, size, weight)
+RETRO_FONTS = {
+    'retro_title': ("Courier", 10, "bold"),
+    'retro_text': ("Courier", 9, "bold"),
+    'retro_small': ("Courier", 8, "bold"),
+    'retro_large': ("Courier", 12, "bold"),
+    'retro_tiny': ("Courier", 7, "bold"),
+}
+
+# Fonts created so far, per Tk root and (family, size, weight)
+_fonts_by_root = weakref.WeakKeyDictionary()
+
+
+def get_fonts(root, specs):
+    """Return {name: Font} for a spec dict like RETRO_FONTS on a Tk root;
+    each distinct font is created once per root and shared by every caller"""
+    cache = _fonts_by_root.get(root)
+    if cache is None:
+        cache = _fonts_by_root[root] = {}
+    fonts = {}
+    for name, spec in specs.items():
+        font = cache.get(spec)
+        if font is None:
+            family, size, weight = spec
+            font = cache[spec] = tkFont.Font(root=root, family=family, size=size, weight=weight)
+        fonts[name] = font
+    return fonts
+
+
+class SyntheticKeyEvent:
+    """Minimal stand-in for a Tk key event forwarded to a game"""
+    __slots__ = ('keysym', 'char')
+
+    def __init__(self, keysym='', char=''):
+        self.keysym = keysym
+        self.char = char
+
+
+# Preallocated key events the games send themselves for gamepad input
+GAMEPAD_KEY_EVENTS = {keysym: SyntheticKeyEvent(keysym, char)
+                      for keysym, char in (("Up", ""), ("Down", ""), ("Left", ""), ("Right", ""),
+                                           ("Return", "\r"), ("Escape", "\x1b"))}
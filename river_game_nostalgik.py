@@ -7,12 +7,45 @@ Licensed under MIT License - see LICENSE file for details
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox
-import tkinter.font as tkFont
-import random
-import threading
+import bisect
 import time
-import pygame  # For gamepad support
+from gamepad_poller import poller  # For gamepad support
+from nostalgik_common import GAMEPAD_KEY_EVENTS, RETRO_FONTS, get_fonts
+
+# Screen transitions end with exactly one parent.update_idletasks() so the
+# new screen is laid out in one pass; this module never calls update()
+
+# Board refreshes are capped at ~30 per second
+MIN_REFRESH_MS = 33
+
+# Held D-Pad repeats move the selection at most once per 120 ms
+NAV_COOLDOWN_NS = 120_000_000
+
+# Each river bank is a bitmask of who is standing on it
+FARMER, WOLF, GOAT, CABBAGE = 1, 2, 4, 8
+ALL_CHARACTERS = FARMER | WOLF | GOAT | CABBAGE
+WOLF_GOAT = WOLF | GOAT
+GOAT_CABBAGE = GOAT | CABBAGE
+
+# Lower-cased keysym -> name of the game method it triggers
+_KEY_MAP = {
+    # Direction keys
+    'up': 'dpad_up', 'w': 'dpad_up',
+    'down': 'dpad_down', 's': 'dpad_down',
+    'left': 'dpad_left', 'a': 'dpad_left',
+    'right': 'dpad_right', 'd': 'dpad_right',
+    # Action buttons
+    'return': 'x_button_action', 'space': 'x_button_action', 'x': 'x_button_action',
+    'escape': 'y_button_action', 'backspace': 'y_button_action', 'y': 'y_button_action',
+    'tab': 'exit_game',
+}
+
+# Victory rating: RATINGS[i] applies up to RATING_THRESHOLDS[i] moves, the last one beyond
+RATING_THRESHOLDS = (7, 10, 15)
+RATINGS = ("PERFECT! Optimal solution!",
+           "EXCELLENT! Very efficient!",
+           "GOOD! Well done!",
+           "COMPLETED! Great job!")
 
 class NostalgiKitRiverGame:
     def __init__(self, parent, return_callback):
@@ -20,22 +53,30 @@ class NostalgiKitRiverGame:
         self.return_callback = return_callback
         
         # Game state
-        self.west_side = ["Farmer", "Wolf", "Goat", "Cabbage"]
-        self.east_side = []
-        self.boat_position = "west"  # "west" or "east"
-        self.boat_contents = []
+        self.west_mask = ALL_CHARACTERS
+        self.east_mask = 0
+        self.boat_at_west = True  # False once the boat is on the east bank
+        self.boat_mask = 0
         self.game_won = False
         self.move_count = 0
         self.selected_item = 0  # For D-Pad selection
+        self.available_options = ["Alone"]
+        self._last_nav_ns = 0
         
         # Character data with NostalgiKit style icons
         self.characters = {
-            "Farmer": {"icon": "F", "desc": "Farmer"},
-            "Wolf": {"icon": "W", "desc": "Wolf"},
-            "Goat": {"icon": "G", "desc": "Goat"},
-            "Cabbage": {"icon": "C", "desc": "Cabbage"}
+            "Farmer": {"icon": "F", "desc": "Farmer", "bit": FARMER},
+            "Wolf": {"icon": "W", "desc": "Wolf", "bit": WOLF},
+            "Goat": {"icon": "G", "desc": "Goat", "bit": GOAT},
+            "Cabbage": {"icon": "C", "desc": "Cabbage", "bit": CABBAGE}
         }
         
+        # Display string for each of the 16 possible bank/boat masks
+        self._icon_table = {}
+        for mask in range(ALL_CHARACTERS + 1):
+            icons = "".join(info["icon"] for info in self.characters.values() if mask & info["bit"])
+            self._icon_table[mask] = icons or "."
+        
         # NostalgiKit colors (matching game_hub.py exactly)
         self.colors = {
             'NostalgiKit_cream': '#E8E0C7',      # Main vintage cream color
@@ -50,20 +91,27 @@ class NostalgiKitRiverGame:
         }
         
         self.current_screen = "intro"
+        self._refresh_scheduled = False
+        self._last_refresh_ms = 0
+        self._gamepad_active = False
         self.gamepad_polling_active = True
         self.setup_fonts()
+        self.setup_text_vars()
         self.setup_retro_interface()
         self.init_gamepad()
         
     def setup_fonts(self):
         """Setup NostalgiKit style fonts (matching game_hub.py exactly)"""
-        self.fonts = {
-            'retro_title': tkFont.Font(family="Courier", size=10, weight="bold"),
-            'retro_text': tkFont.Font(family="Courier", size=9, weight="bold"),
-            'retro_small': tkFont.Font(family="Courier", size=8, weight="bold"),
-            'retro_large': tkFont.Font(family="Courier", size=12, weight="bold"),
-            'retro_tiny': tkFont.Font(family="Courier", size=7, weight="bold")
-        }
+        self.fonts = get_fonts(self.parent.winfo_toplevel(), RETRO_FONTS)
+        
+    def setup_text_vars(self):
+        """Text variables behind the labels that change between visits"""
+        self._status_var = tk.StringVar(self.parent)
+        self._instruction_var = tk.StringVar(self.parent)
+        self._option_vars = [tk.StringVar(self.parent) for _ in range(4)]
+        self._loss_reason_var = tk.StringVar(self.parent)
+        self._stats_var = tk.StringVar(self.parent)
+        self._rating_var = tk.StringVar(self.parent)
         
     def setup_retro_interface(self):
         """Create game interface inside hub's screen frame"""
@@ -72,8 +120,9 @@ class NostalgiKitRiverGame:
         if not hasattr(self, 'game_frame') or not self.game_frame.winfo_exists():
             self.game_frame = tk.Frame(self.parent, bg=self.colors['screen_green'])
             self.game_frame.pack(fill='both', expand=True)
+            self.build_screens()
         
-        # Clear any previous content
+        # Hide whichever screen was showing last time
         self.clear_screen()
         
         # Setup keyboard bindings to root window
@@ -87,33 +136,36 @@ class NostalgiKitRiverGame:
     
     def on_key_press(self, event):
         """Handle keyboard input"""
-        key = event.keysym.lower()
-        
-        # Direction keys
-        if key in ['up', 'w']:
-            self.dpad_up()
-        elif key in ['down', 's']:
-            self.dpad_down()
-        elif key in ['left', 'a']:
-            self.dpad_left()
-        elif key in ['right', 'd']:
-            self.dpad_right()
-        # Action buttons
-        elif key in ['return', 'space', 'x']:
-            self.x_button_action()
-        elif key in ['escape', 'backspace', 'y']:
-            self.y_button_action()
-        elif key in ['tab']:
-            self.exit_game()
+        method = _KEY_MAP.get(event.keysym.lower())
+        if method is not None:
+            getattr(self, method)()
             
-    def show_intro(self):
-        """Show game introduction"""
+    def build_screens(self):
+        """Build every screen once; show_screen switches between them"""
+        self._screens = {}
+        self._current_frame = None
+        for name, build in (("intro", self.build_intro),
+                            ("game", self.build_game_board),
+                            ("loss", self.build_loss),
+                            ("victory", self.build_victory)):
+            content = tk.Frame(self.game_frame, bg=self.colors['screen_green'])
+            build(content)
+            self._screens[name] = content
+            
+    def show_screen(self, name, pad):
+        """Replace the visible screen with the prebuilt one for name"""
         self.clear_screen()
-        self.current_screen = "intro"
+        self.current_screen = name
+        self._current_frame = self._screens[name]
+        self._current_frame.pack(fill='both', expand=True, padx=pad, pady=pad)
         
-        content = tk.Frame(self.game_frame, bg=self.colors['screen_green'])
-        content.pack(fill='both', expand=True, padx=5, pady=5)
+    def show_intro(self):
+        """Show game introduction"""
+        self.show_screen("intro", 5)
+        self.parent.update_idletasks()
         
+    def build_intro(self, content):
+        """Create the introduction screen widgets"""
         # Title
         title_label = tk.Label(content,
                               text="RIVER PUZZLE",
@@ -158,21 +210,42 @@ safely!"""
         
     def start_game(self):
         """Start the actual game"""
-        self.west_side = ["Farmer", "Wolf", "Goat", "Cabbage"]
-        self.east_side = []
-        self.boat_position = "west"
-        self.boat_contents = []
+        self.west_mask = ALL_CHARACTERS
+        self.east_mask = 0
+        self.boat_at_west = True
+        self.boat_mask = 0
         self.game_won = False
         self.move_count = 0
         self.selected_item = 0
         self.current_screen = "game"
+        self.rebuild_options()
         
         self.show_game_board()
         
     def show_game_board(self):
-        """Show the main game board"""
-        self.clear_screen()
+        """Show the game board, filled from the game state"""
+        self.show_screen("game", 3)
+        self.refresh_game_board()
+        self.parent.update_idletasks()
+        
+    def build_game_board(self, content):
+        """Create the game board widgets"""
+        # Status bar
+        self.status_lbl = tk.Label(content,
+                                   textvariable=self._status_var,
+                                   font=self.fonts['retro_small'],
+                                   fg=self.colors['screen_dark'],
+                                   bg=self.colors['screen_green'])
+        self.status_lbl.pack(pady=2)
+        
+        # River visualization
+        self.draw_river_scene(content)
+        
+        # Action area
+        self.create_action_area(content)
         
+    def refresh_game_board(self):
+        """Update the board labels in place after a move or selection change"""
         # Check for game end conditions
         loss_reason = self.check_loss()
         if loss_reason:
@@ -181,153 +254,115 @@ safely!"""
         elif self.check_win():
             self.show_victory()
             return
-            
-        content = tk.Frame(self.game_frame, bg=self.colors['screen_green'])
-        content.pack(fill='both', expand=True, padx=3, pady=3)
-        
-        # Status bar
-        status_text = f"Moves:{self.move_count}"
-        status_label = tk.Label(content,
-                               text=status_text,
-                               font=self.fonts['retro_small'],
-                               fg=self.colors['screen_dark'],
-                               bg=self.colors['screen_green'])
-        status_label.pack(pady=2)
         
-        # River visualization
-        self.draw_river_scene(content)
+        self._last_refresh_ms = time.monotonic_ns() // 1_000_000
+        self._status_var.set(f"Moves:{self.move_count}")
         
-        # Action area
-        self.create_action_area(content)
+        # River banks and boat
+        self.river_canvas.itemconfig(self._west_id, text=self._icon_table[self.west_mask])
+        self.river_canvas.itemconfig(self._east_id, text=self._icon_table[self.east_mask])
         
-    def draw_river_scene(self, parent):
-        """Draw simplified river scene"""
-        river_frame = tk.Frame(parent, bg=self.colors['screen_green'])
-        river_frame.pack(fill='x', pady=5)
-        
-        # West side
-        west_frame = tk.Frame(river_frame, bg=self.colors['screen_green'])
-        west_frame.pack(side='left', fill='x', expand=True)
-        
-        west_label = tk.Label(west_frame,
-                             text="WEST",
-                             font=self.fonts['retro_tiny'],
-                             fg=self.colors['screen_dark'],
-                             bg=self.colors['screen_green'])
-        west_label.pack()
-        
-        west_chars = "".join([self.characters[char]["icon"] for char in self.west_side])
-        if not west_chars:
-            west_chars = "."
-            
-        west_display = tk.Label(west_frame,
-                               text=west_chars,
-                               font=self.fonts['retro_text'],
-                               fg=self.colors['screen_dark'],
-                               bg=self.colors['screen_green'])
-        west_display.pack()
+        boat_contents = self._icon_table[self.boat_mask]
+        boat_symbol = "<" if self.boat_at_west else ">"
+        self.river_canvas.itemconfig(self._boat_id, text=f"{boat_symbol}{boat_contents}{boat_symbol}")
         
-        # River and boat
-        river_frame_mid = tk.Frame(river_frame, bg=self.colors['screen_green'], width=60)
-        river_frame_mid.pack(side='left')
-        river_frame_mid.pack_propagate(False)
+        # Action area
+        current_side = self.west_mask if self.boat_at_west else self.east_mask
         
-        river_label = tk.Label(river_frame_mid,
-                              text="~~~~",
-                              font=self.fonts['retro_small'],
-                              fg=self.colors['screen_dark'],
-                              bg=self.colors['screen_green'])
-        river_label.pack()
+        if not current_side & FARMER:
+            # Farmer not on current side, can only move boat
+            self._instruction_var.set("X=Move Boat")
+            self.options_frame.pack_forget()
+            return
         
-        # Boat
-        boat_contents = "".join([self.characters[char]["icon"] for char in self.boat_contents])
-        if not boat_contents:
-            boat_contents = "."
+        # Farmer is on current side
+        self._instruction_var.set("Choose companion:")
+        self.options_frame.pack(fill='x', after=self.instruction_lbl)
+        
+        # Show one option slot per available option, in order
+        if self.shown_options != len(self.available_options):
+            for option_lbl in self.option_lbls:
+                option_lbl.pack_forget()
+            for option_lbl in self.option_lbls[:len(self.available_options)]:
+                option_lbl.pack(fill='x', padx=10)
+            self.shown_options = len(self.available_options)
             
-        boat_symbol = "<" if self.boat_position == "west" else ">"
-        boat_text = f"{boat_symbol}{boat_contents}{boat_symbol}"
-        
-        boat_label = tk.Label(river_frame_mid,
-                             text=boat_text,
-                             font=self.fonts['retro_small'],
-                             fg=self.colors['screen_dark'],
-                             bg=self.colors['screen_green'])
-        boat_label.pack()
-        
-        # East side
-        east_frame = tk.Frame(river_frame, bg=self.colors['screen_green'])
-        east_frame.pack(side='left', fill='x', expand=True)
-        
-        east_label = tk.Label(east_frame,
-                             text="EAST",
-                             font=self.fonts['retro_tiny'],
-                             fg=self.colors['screen_dark'],
-                             bg=self.colors['screen_green'])
-        east_label.pack()
-        
-        east_chars = "".join([self.characters[char]["icon"] for char in self.east_side])
-        if not east_chars:
-            east_chars = "."
+        # Display options
+        for i, option in enumerate(self.available_options):
+            marker = "> " if i == self.selected_item else "  "
+            self._option_vars[i].set(marker + option)
             
-        east_display = tk.Label(east_frame,
-                               text=east_chars,
-                               font=self.fonts['retro_text'],
-                               fg=self.colors['screen_dark'],
-                               bg=self.colors['screen_green'])
-        east_display.pack()
+        # Only the old and new highlighted slots need restyling
+        if self.highlighted_option != self.selected_item:
+            if self.highlighted_option is not None:
+                self.option_lbls[self.highlighted_option].config(fg=self.colors['screen_dark'],
+                                                                 bg=self.colors['screen_green'])
+            self.option_lbls[self.selected_item].config(fg=self.colors['screen_green'],
+                                                        bg=self.colors['screen_dark'])
+            self.highlighted_option = self.selected_item
+        
+    def draw_river_scene(self, parent):
+        """Draw simplified river scene as text items on a single canvas"""
+        # Row 1: bank names and the river, row 2: bank contents and the boat
+        title_height = max(self.fonts['retro_tiny'].metrics('linespace'),
+                           self.fonts['retro_small'].metrics('linespace'))
+        row_height = max(self.fonts['retro_text'].metrics('linespace'),
+                         self.fonts['retro_small'].metrics('linespace'))
+        
+        self.river_canvas = tk.Canvas(parent,
+                                      width=1,
+                                      height=title_height + row_height,
+                                      bg=self.colors['screen_green'],
+                                      highlightthickness=0)
+        self.river_canvas.pack(fill='x', pady=5)
+        
+        # (item, column, y) for each text item; columns are west bank, river, east bank
+        self._river_items = []
+        for column, y, text, font in ((0, 0, "WEST", 'retro_tiny'),
+                                      (1, 0, "~~~~", 'retro_small'),
+                                      (2, 0, "EAST", 'retro_tiny'),
+                                      (0, title_height, "", 'retro_text'),
+                                      (1, title_height, "", 'retro_small'),
+                                      (2, title_height, "", 'retro_text')):
+            item = self.river_canvas.create_text(0, y, text=text, anchor='n',
+                                                 font=self.fonts[font],
+                                                 fill=self.colors['screen_dark'])
+            self._river_items.append((item, column, y))
+        self._west_id, self._boat_id, self._east_id = [item for item, _, _ in self._river_items[3:]]
+        
+        self.river_canvas.bind('<Configure>', self.layout_river_scene)
+        
+    def layout_river_scene(self, event):
+        """Centre the river scene columns: two banks either side of a 60px river"""
+        bank_width = max(event.width - 60, 0) / 2
+        column_x = (bank_width / 2, event.width / 2, event.width - bank_width / 2)
+        for item, column, y in self._river_items:
+            self.river_canvas.coords(item, column_x[column], y)
         
     def create_action_area(self, parent):
         """Create action selection area"""
         action_frame = tk.Frame(parent, bg=self.colors['screen_green'])
         action_frame.pack(fill='x', pady=5)
         
-        current_side = self.west_side if self.boat_position == "west" else self.east_side
-        
-        if "Farmer" not in current_side:
-            # Farmer not on current side, can only move boat
-            instruction_label = tk.Label(action_frame,
-                                        text="X=Move Boat",
+        # "X=Move Boat" or "Choose companion:"
+        self.instruction_lbl = tk.Label(action_frame,
+                                        textvariable=self._instruction_var,
                                         font=self.fonts['retro_small'],
                                         fg=self.colors['screen_dark'],
                                         bg=self.colors['screen_green'])
-            instruction_label.pack()
-        else:
-            # Farmer is on current side
-            instruction_label = tk.Label(action_frame,
-                                        text="Choose companion:",
-                                        font=self.fonts['retro_small'],
-                                        fg=self.colors['screen_dark'],
-                                        bg=self.colors['screen_green'])
-            instruction_label.pack()
-            
-            # Available options
-            self.available_options = ["Alone"]
-            for char in current_side:
-                if char != "Farmer":
-                    self.available_options.append(char)
-                    
-            # Ensure selected item is in bounds
-            if self.selected_item >= len(self.available_options):
-                self.selected_item = 0
-                
-            # Display options
-            for i, option in enumerate(self.available_options):
-                if i == self.selected_item:
-                    display_text = f"> {option}"
-                    bg_color = self.colors['screen_dark']
-                    fg_color = self.colors['screen_green']
-                else:
-                    display_text = f"  {option}"
-                    bg_color = self.colors['screen_green']
-                    fg_color = self.colors['screen_dark']
-                    
-                option_label = tk.Label(action_frame,
-                                       text=display_text,
-                                       font=self.fonts['retro_small'],
-                                       fg=fg_color,
-                                       bg=bg_color,
-                                       anchor='w')
-                option_label.pack(fill='x', padx=10)
+        self.instruction_lbl.pack()
+        
+        # One slot per possible option: Alone, Wolf, Goat, Cabbage
+        self.options_frame = tk.Frame(action_frame, bg=self.colors['screen_green'])
+        self.option_lbls = [tk.Label(self.options_frame,
+                                     textvariable=option_var,
+                                     font=self.fonts['retro_small'],
+                                     fg=self.colors['screen_dark'],
+                                     bg=self.colors['screen_green'],
+                                     anchor='w')
+                            for option_var in self._option_vars]
+        self.shown_options = 0
+        self.highlighted_option = None
                 
         # Controls
         controls_label = tk.Label(action_frame,
@@ -339,20 +374,44 @@ safely!"""
         
     def dpad_up(self):
         """Handle D-Pad up"""
-        if self.current_screen == "game":
-            current_side = self.west_side if self.boat_position == "west" else self.east_side
-            if "Farmer" in current_side and hasattr(self, 'available_options'):
+        if self.current_screen == "game" and self.nav_ready():
+            current_side = self.west_mask if self.boat_at_west else self.east_mask
+            if current_side & FARMER:
                 self.selected_item = (self.selected_item - 1) % len(self.available_options)
-                self.show_game_board()
+                self.schedule_refresh()
                 
     def dpad_down(self):
         """Handle D-Pad down"""
-        if self.current_screen == "game":
-            current_side = self.west_side if self.boat_position == "west" else self.east_side
-            if "Farmer" in current_side and hasattr(self, 'available_options'):
+        if self.current_screen == "game" and self.nav_ready():
+            current_side = self.west_mask if self.boat_at_west else self.east_mask
+            if current_side & FARMER:
                 self.selected_item = (self.selected_item + 1) % len(self.available_options)
-                self.show_game_board()
+                self.schedule_refresh()
                 
+    def nav_ready(self):
+        """True if enough time has passed since the last accepted D-Pad move"""
+        now = time.monotonic_ns()
+        if now - self._last_nav_ns < NAV_COOLDOWN_NS:
+            return False
+        self._last_nav_ns = now
+        return True
+        
+    def schedule_refresh(self):
+        """Refresh the board once, at most every MIN_REFRESH_MS, however many presses queued up"""
+        if not self._refresh_scheduled:
+            self._refresh_scheduled = True
+            elapsed_ms = time.monotonic_ns() // 1_000_000 - self._last_refresh_ms
+            if elapsed_ms < MIN_REFRESH_MS:
+                self.parent.after(MIN_REFRESH_MS - elapsed_ms, self.flush_refresh)
+            else:
+                self.parent.after_idle(self.flush_refresh)
+            
+    def flush_refresh(self):
+        """Run the refresh queued by schedule_refresh"""
+        self._refresh_scheduled = False
+        if self.current_screen == "game":
+            self.refresh_game_board()
+            
     def dpad_left(self):
         """Handle D-Pad left"""
         pass  # Not used in this game
@@ -379,64 +438,66 @@ safely!"""
             
     def execute_move(self):
         """Execute the selected move"""
-        current_side = self.west_side if self.boat_position == "west" else self.east_side
-        other_side = self.east_side if self.boat_position == "west" else self.west_side
+        current_side = self.west_mask if self.boat_at_west else self.east_mask
         
-        if "Farmer" not in current_side:
+        if not current_side & FARMER:
             # Just move boat
-            self.boat_position = "east" if self.boat_position == "west" else "west"
+            self.boat_at_west = not self.boat_at_west
             self.move_count += 1
         else:
             # Move farmer with selected companion
-            if hasattr(self, 'available_options'):
-                selected_option = self.available_options[self.selected_item]
-                
-                # Move farmer
-                current_side.remove("Farmer")
-                other_side.append("Farmer")
+            selected_option = self.available_options[self.selected_item]
+            
+            # Move farmer, and the companion if not alone
+            moving = FARMER
+            if selected_option != "Alone":
+                moving |= self.characters[selected_option]["bit"]
                 
-                # Move companion if not alone
-                if selected_option != "Alone":
-                    current_side.remove(selected_option)
-                    other_side.append(selected_option)
-                    
-                # Move boat
-                self.boat_position = "east" if self.boat_position == "west" else "west"
-                self.move_count += 1
-                self.selected_item = 0
+            # Everyone moving is on the current bank, so flipping
+            # their bits on both banks carries them across
+            self.west_mask ^= moving
+            self.east_mask ^= moving
                 
-        self.show_game_board()
+            # Move boat
+            self.boat_at_west = not self.boat_at_west
+            self.move_count += 1
+            self.selected_item = 0
+            
+        self.rebuild_options()
+        self.refresh_game_board()
+        
+    def rebuild_options(self):
+        """Recompute the companion choices after the banks or boat change"""
+        current_side = self.west_mask if self.boat_at_west else self.east_mask
+        self.available_options = ["Alone"]
+        for char in ("Wolf", "Goat", "Cabbage"):
+            if current_side & self.characters[char]["bit"]:
+                self.available_options.append(char)
+        self.selected_item %= len(self.available_options)
         
     def check_loss(self):
         """Check if game is lost"""
-        # Check west side
-        if "Farmer" not in self.west_side:
-            if "Wolf" in self.west_side and "Goat" in self.west_side:
-                return "Wolf ate Goat!"
-            if "Goat" in self.west_side and "Cabbage" in self.west_side:
-                return "Goat ate Cabbage!"
-                
-        # Check east side
-        if "Farmer" not in self.east_side:
-            if "Wolf" in self.east_side and "Goat" in self.east_side:
-                return "Wolf ate Goat!"
-            if "Goat" in self.east_side and "Cabbage" in self.east_side:
-                return "Goat ate Cabbage!"
+        for side in (self.west_mask, self.east_mask):
+            if not side & FARMER:
+                if side & WOLF_GOAT == WOLF_GOAT:
+                    return "Wolf ate Goat!"
+                if side & GOAT_CABBAGE == GOAT_CABBAGE:
+                    return "Goat ate Cabbage!"
                 
         return False
         
     def check_win(self):
         """Check if game is won"""
-        return len(self.east_side) == 4 and all(char in self.east_side for char in ["Farmer", "Wolf", "Goat", "Cabbage"])
+        return self.east_mask == ALL_CHARACTERS
         
     def show_loss(self, reason):
         """Show loss screen"""
-        self.clear_screen()
-        self.current_screen = "loss"
-        
-        content = tk.Frame(self.game_frame, bg=self.colors['screen_green'])
-        content.pack(fill='both', expand=True, padx=5, pady=5)
+        self._loss_reason_var.set(reason)
+        self.show_screen("loss", 5)
+        self.parent.update_idletasks()
         
+    def build_loss(self, content):
+        """Create the loss screen widgets"""
         # Loss title
         title_label = tk.Label(content,
                               text="GAME OVER",
@@ -447,7 +508,7 @@ safely!"""
         
         # Reason
         reason_label = tk.Label(content,
-                               text=reason,
+                               textvariable=self._loss_reason_var,
                                font=self.fonts['retro_text'],
                                fg=self.colors['screen_dark'],
                                bg=self.colors['screen_green'])
@@ -478,12 +539,16 @@ alone together!"""
         
     def show_victory(self):
         """Show victory screen"""
-        self.clear_screen()
-        self.current_screen = "victory"
+        self._stats_var.set(f"Completed in{self.move_count} moves!")
+        
+        # Performance rating
+        self._rating_var.set(RATINGS[bisect.bisect_left(RATING_THRESHOLDS, self.move_count)])
         
-        content = tk.Frame(self.game_frame, bg=self.colors['screen_green'])
-        content.pack(fill='both', expand=True, padx=5, pady=5)
+        self.show_screen("victory", 5)
+        self.parent.update_idletasks()
         
+    def build_victory(self, content):
+        """Create the victory screen widgets"""
         # Victory title
         title_label = tk.Label(content,
                               text="SUCCESS!",
@@ -493,9 +558,8 @@ alone together!"""
         title_label.pack(pady=10)
         
         # Stats
-        stats_text = f"Completed in{self.move_count} moves!"
         stats_label = tk.Label(content,
-                              text=stats_text,
+                              textvariable=self._stats_var,
                               font=self.fonts['retro_text'],
                               fg=self.colors['screen_dark'],
                               bg=self.colors['screen_green'],
@@ -503,17 +567,8 @@ alone together!"""
         stats_label.pack(pady=10)
         
         # Performance rating
-        if self.move_count <= 7:
-            rating = "PERFECT! Optimal solution!"
-        elif self.move_count <= 10:
-            rating = "EXCELLENT! Very efficient!"
-        elif self.move_count <= 15:
-            rating = "GOOD! Well done!"
-        else:
-            rating = "COMPLETED! Great job!"
-            
         rating_label = tk.Label(content,
-                               text=rating,
+                               textvariable=self._rating_var,
                                font=self.fonts['retro_small'],
                                fg=self.colors['screen_dark'],
                                bg=self.colors['screen_green'],
@@ -537,10 +592,10 @@ alone together!"""
         controls_label.pack(side='bottom', pady=5)
         
     def clear_screen(self):
-        """Clear the screen - remove all children but keep the frame"""
-        # Only destroy children of game_frame, not the frame itself
-        for widget in self.game_frame.winfo_children():
-            widget.destroy()
+        """Hide the current screen - its frame is kept for the next visit"""
+        if self._current_frame is not None:
+            self._current_frame.pack_forget()
+            self._current_frame = None
     
     def exit_game(self):
         """Exit game and return to hub"""
@@ -556,93 +611,55 @@ alone together!"""
         self.clear_screen()
         self.return_callback()
     
+    @property
+    def gamepad_polling_active(self):
+        """True while this game should react to gamepad input"""
+        return self._gamepad_active
+    
+    @gamepad_polling_active.setter
+    def gamepad_polling_active(self, active):
+        # (Un)subscribes from the shared gamepad poller
+        if active and not self._gamepad_active:
+            poller.subscribe(self.parent, self.on_gamepad_button, self.on_gamepad_hat)
+        elif not active and self._gamepad_active:
+            poller.unsubscribe(self.on_gamepad_button)
+        self._gamepad_active = active
+    
     def init_gamepad(self):
         """Initialize gamepad support"""
         try:
-            if not pygame.get_init():
-                pygame.init()
-            if not pygame.joystick.get_init():
-                pygame.joystick.init()
-            
-            self.joystick = None
+            poller.start()
             self.gamepad_enabled = True
-            self.last_button_state = {}
-            self.last_hat = (0, 0)
-            
-            if pygame.joystick.get_count() > 0:
-                self.joystick = pygame.joystick.Joystick(0)
-                self.joystick.init()
-            
-            self.parent.after(30, self.poll_gamepad)
         except Exception as e:
             print(f"Gamepad init error: {e}")
             self.gamepad_enabled = False
     
-    def poll_gamepad(self):
-        """Poll gamepad input"""
-        if not self.gamepad_enabled or not self.gamepad_polling_active:
+    def on_gamepad_button(self, button):
+        """Turn a gamepad button press into the matching key press"""
+        # The game may have exited since this event was queued
+        if not self.gamepad_polling_active:
             return
-        
-        try:
-            self.parent.winfo_exists()
-        except:
+        if button in (0, 2):  # A or X
+            self.on_key_press(GAMEPAD_KEY_EVENTS["Return"])
+        elif button in (1, 3):  # B or Y
+            self.on_key_press(GAMEPAD_KEY_EVENTS["Escape"])
+    
+    def on_gamepad_hat(self, value):
+        """Turn a D-Pad move into the matching key press"""
+        if not self.gamepad_polling_active:
             return
-        
-        try:
-            pygame.event.pump()
-            
-            if self.joystick is not None and self.joystick.get_init():
-                def is_pressed(btn):
-                    try:
-                        return self.joystick.get_button(btn) == 1
-                    except:
-                        return False
-                
-                def just_pressed(btn):
-                    current = is_pressed(btn)
-                    previous = self.last_button_state.get(btn, False)
-                    self.last_button_state[btn] = current
-                    return current and not previous
-                
-                # Simulate key presses  
-                if just_pressed(0) or just_pressed(2):  # A or X
-                    event = type('Event', (), {'keysym': 'Return', 'char': '\r'})()
-                    self.on_key_press(event)
-                
-                if just_pressed(1) or just_pressed(3):  # B or Y
-                    event = type('Event', (), {'keysym': 'Escape', 'char': '\x1b'})()
-                    self.on_key_press(event)
-                
-                # D-Pad
-                try:
-                    hat = self.joystick.get_hat(0)
-                    if hat != self.last_hat:
-                        if hat == (0, 1):  # UP
-                            event = type('Event', (), {'keysym': 'Up', 'char': ''})()
-                            self.on_key_press(event)
-                        elif hat == (0, -1):  # DOWN
-                            event = type('Event', (), {'keysym': 'Down', 'char': ''})()
-                            self.on_key_press(event)
-                        self.last_hat = hat
-                except:
-                    pass
-        
-        except Exception as e:
-            if "bad window" not in str(e):
-                print(f"Gamepad poll error: {e}")
-        
-        try:
-            self.parent.after(30, self.poll_gamepad)
-        except:
-            pass
+        if value == (0, 1):  # UP
+            self.on_key_press(GAMEPAD_KEY_EVENTS["Up"])
+        elif value == (0, -1):  # DOWN
+            self.on_key_press(GAMEPAD_KEY_EVENTS["Down"])
     
     def show(self):
         """Show game again (reuse instance)"""
         # Oyun durumunu sıfırla
-        self.west_side = ["Farmer", "Wolf", "Goat", "Cabbage"]
-        self.east_side = []
-        self.boat_position = "west"
-        self.boat_contents = []
+        self.west_mask = ALL_CHARACTERS
+        self.east_mask = 0
+        self.boat_at_west = True
+        self.boat_mask = 0
         self.game_won = False
         self.move_count = 0
         self.selected_item = 0
@@ -653,7 +670,6 @@ alone together!"""
         # Gamepad'i yeniden başlat
         if self.gamepad_enabled:
             self.gamepad_polling_active = True
-            self.parent.after(100, self.poll_gamepad)
 
 # Update the import
 RiverGame = NostalgiKitRiverGame
@@ -7,10 +7,11 @@ Licensed under MIT License - see LICENSE file for details
 """
 
 import tkinter as tk
-import tkinter.font as tkFont
+import collections
 import random
 import time
-import pygame  # For gamepad support
+from gamepad_poller import poller  # For gamepad support
+from nostalgik_common import RETRO_FONTS, get_fonts
 
 
 class NostalgiKitTetris:
@@ -24,13 +25,23 @@ class NostalgiKitTetris:
         self.block = 16
         self.canvas_width = self.cols * self.block
         self.canvas_height = self.rows * self.block
+        self._full_row_mask = (1 << self.cols) - 1
+        self._top_pad = 2  # Always-empty rows above the playfield in row_mask
 
         # Game timing
         self.drop_delay = 650
         self.loop_job = None
+        self._dirty = False
+        self._draw_job = None
+
+        # Gamepad: a held D-Pad direction repeats every hat_repeat_ms
+        self.hat_repeat_ms = 40
+        self._hat_job = None
+        self._gamepad_active = False
 
         # State
-        self.grid = None
+        self.grid = None  # Flat bytearray of colour ids, 0 = empty, index y * cols + x
+        self.row_mask = None  # Occupied cells per row (row y at y + _top_pad), bit x = column x
         self.current_piece = None
         self.next_piece = None
         self.score = 0
@@ -51,14 +62,10 @@ class NostalgiKitTetris:
             "highlight": "#FFD23F",
         }
         self.piece_palette = ["#dcefb1", "#cde687", "#bcd971", "#a8cc61", "#8fb54c"]
+        self._cell_colors = [None] + self.piece_palette  # By colour id
 
         # Fonts
-        self.fonts = {
-            "retro_title": tkFont.Font(family="Courier", size=10, weight="bold"),
-            "retro_text": tkFont.Font(family="Courier", size=9, weight="bold"),
-            "retro_small": tkFont.Font(family="Courier", size=8, weight="bold"),
-            "retro_tiny": tkFont.Font(family="Courier", size=7, weight="bold"),
-        }
+        self.fonts = get_fonts(self.parent.winfo_toplevel(), RETRO_FONTS)
 
         # Pieces (rotation states)
         self.tetrominoes = {
@@ -95,6 +102,34 @@ class NostalgiKitTetris:
             ],
         }
 
+        # Immutable (dx, dy) offsets per shape and rotation for the hot paths
+        self._shape_table = {
+            shape: tuple(tuple(cells) for cells in rotations)
+            for shape, rotations in self.tetrominoes.items()
+        }
+        # Per shape and rotation: (min dx, max dx, max dy, ((dy + _top_pad, row bits), ...)),
+        # row bits counted from min dx so can_place tests a row with one AND
+        self._piece_rows = {}
+        for shape, rotations in self._shape_table.items():
+            states = []
+            for cells in rotations:
+                min_dx = min(x for x, _ in cells)
+                max_dx = max(x for x, _ in cells)
+                rows = {}
+                for x, y in cells:
+                    rows[y] = rows.get(y, 0) | 1 << (x - min_dx)
+                padded_rows = tuple((y + self._top_pad, bits) for y, bits in sorted(rows.items()))
+                states.append((min_dx, max_dx, max(rows), padded_rows))
+            self._piece_rows[shape] = tuple(states)
+
+        # 7-bag randomiser: every shape once per shuffled bag; colours cycle
+        self._shape_keys = tuple(self.tetrominoes)
+        self._bag = collections.deque()
+        self._palette_i = 0
+        # The current and next piece alternate between these two dicts
+        self._piece_a = {}
+        self._piece_b = {}
+
         self.bound_keys = []
         self.setup_ui()
         self.init_gamepad()
@@ -151,6 +186,8 @@ class NostalgiKitTetris:
             bg=self.colors["screen_dark"],
         )
         self.status_label.pack(side="right", padx=5)
+        # Values the HUD labels currently show
+        self._hud_cache = {"score": 0, "lines": 0, "level": 1}
 
         body = tk.Frame(self.game_frame, bg=self.colors["screen_green"])
         body.pack(fill="both", expand=True)
@@ -164,6 +201,7 @@ class NostalgiKitTetris:
             highlightthickness=0,
         )
         self.canvas.pack(side="left", padx=6, pady=6)
+        self.create_board_items()
 
         # Next preview
         sidebar = tk.Frame(body, bg=self.colors["screen_green"], width=80)
@@ -199,8 +237,48 @@ class NostalgiKitTetris:
 
         self.bind_keys()
 
+    def create_board_items(self):
+        # Settled cells, the active piece and the grid lines are created once;
+        # draw() only reconfigures the items that changed
+        self.cell_ids = [
+            self.create_block_item(x, y, "cell") for y in range(self.rows) for x in range(self.cols)
+        ]
+        self._prev_grid = bytearray(self.rows * self.cols)
+        self.piece_ids = [self.create_block_item(0, 0, "piece") for _ in range(4)]
+        self._piece_color = None
+        self._piece_shown = False
+        # Grid lines for clarity
+        for x in range(self.cols + 1):
+            px = x * self.block
+            self.canvas.create_line(px, 0, px, self.canvas_height, fill=self.colors["screen_dark"], width=1)
+        for y in range(self.rows + 1):
+            py = y * self.block
+            self.canvas.create_line(0, py, self.canvas_width, py, fill=self.colors["screen_dark"], width=1)
+
+    def create_block_item(self, x, y, tag):
+        px = x * self.block
+        py = y * self.block
+        return self.canvas.create_rectangle(
+            px + 1,
+            py + 1,
+            px + self.block - 1,
+            py + self.block - 1,
+            outline=self.colors["screen_green"],
+            state="hidden",
+            tags=(tag,),
+        )
+
+    def clear_board_items(self):
+        self.cancel_draw()
+        self.canvas.delete("overlay")
+        self.canvas.itemconfigure("cell", state="hidden")
+        self.canvas.itemconfigure("piece", state="hidden")
+        self._prev_grid = bytearray(self.rows * self.cols)
+        self._piece_shown = False
+
     def bind_keys(self):
-        self.unbind_keys()
+        if self.bound_keys:
+            return  # Still bound from the last call
         root = self.parent.winfo_toplevel()
         bindings = {
             "<Left>": lambda e: self.dpad_left(),
@@ -243,8 +321,9 @@ class NostalgiKitTetris:
         self.game_active = False
         self.game_over = False
         self.paused = False
-        self.grid = [[None for _ in range(self.cols)] for _ in range(self.rows)]
-        self.canvas.delete("all")
+        self.grid = bytearray(self.rows * self.cols)
+        self.row_mask = [0] * (self._top_pad + self.rows)
+        self.clear_board_items()
         self.preview.delete("all")
         self.status_label.config(text="READY")
         self.score = 0
@@ -256,6 +335,7 @@ class NostalgiKitTetris:
         self.canvas.create_text(
             mid_x,
             110,
+            tags=("overlay",),
             text="BLOCK STACK",
             font=self.fonts["retro_title"],
             fill=self.colors["highlight"],
@@ -263,6 +343,7 @@ class NostalgiKitTetris:
         self.canvas.create_text(
             mid_x,
             150,
+            tags=("overlay",),
             text="PRESS START / ENTER",
             font=self.fonts["retro_text"],
             fill=self.colors["nostalgik_cream"],
@@ -270,6 +351,7 @@ class NostalgiKitTetris:
         self.canvas.create_text(
             mid_x,
             190,
+            tags=("overlay",),
             text="X ROTATE  SPACE HARD DROP",
             font=self.fonts["retro_tiny"],
             fill=self.colors["nostalgik_cream"],
@@ -284,12 +366,16 @@ class NostalgiKitTetris:
         self.game_active = True
         self.game_over = False
         self.paused = False
-        self.grid = [[None for _ in range(self.cols)] for _ in range(self.rows)]
+        self.grid = bytearray(self.rows * self.cols)
+        self.row_mask = [0] * (self._top_pad + self.rows)
         self.score = 0
         self.lines = 0
         self.level = 1
         self.update_drop_speed()
-        self.next_piece = self.random_piece()
+        self.clear_board_items()
+        self._bag.clear()
+        self.current_piece = None
+        self.next_piece = self.random_piece(self._piece_a)
         self.spawn_piece()
         self.update_hud()
         self.status_label.config(text="PLAY")
@@ -317,33 +403,52 @@ class NostalgiKitTetris:
     # ------------------------------------------------------------------
     # Pieces and movement
     # ------------------------------------------------------------------
-    def random_piece(self):
-        shape = random.choice(list(self.tetrominoes.keys()))
-        color = random.choice(self.piece_palette)
-        return {"shape": shape, "rotation": 0, "color": color}
+    def random_piece(self, dst):
+        if not self._bag:
+            shapes = list(self._shape_keys)
+            random.shuffle(shapes)
+            self._bag.extend(shapes)
+        shape = self._bag.popleft()
+        self._palette_i = (self._palette_i + 1) % len(self.piece_palette)
+        color_id = self._palette_i + 1
+        dst["shape"] = shape
+        dst["rotation"] = 0
+        dst["color"] = self._cell_colors[color_id]
+        dst["color_id"] = color_id
+        return dst
 
     def spawn_piece(self):
+        spare = self._piece_b if self.next_piece is self._piece_a else self._piece_a
         self.current_piece = self.next_piece
-        self.next_piece = self.random_piece()
+        self.next_piece = self.random_piece(spare)
         self.current_piece["x"] = self.cols // 2 - 2
         self.current_piece["y"] = 0
         if not self.can_place(self.current_piece):
             self.trigger_game_over()
             return
-        self.draw()
+        self.request_draw()
+        self.draw_preview()
 
     def piece_cells(self, piece, rotation=None):
         rot = piece["rotation"] if rotation is None else rotation
-        shape_states = self.tetrominoes[piece["shape"]]
+        shape_states = self._shape_table[piece["shape"]]
         cells = shape_states[rot % len(shape_states)]
-        return [(piece["x"] + x, piece["y"] + y) for x, y in cells]
+        px, py = piece["x"], piece["y"]
+        return [(px + x, py + y) for x, y in cells]
 
     def can_place(self, piece, dx=0, dy=0, rotation=None):
-        for x, y in self.piece_cells(piece, rotation):
-            nx, ny = x + dx, y + dy
-            if nx < 0 or nx >= self.cols or ny >= self.rows:
-                return False
-            if ny >= 0 and self.grid[ny][nx] is not None:
+        rot = piece["rotation"] if rotation is None else rotation
+        states = self._piece_rows[piece["shape"]]
+        min_dx, max_dx, max_dy, piece_rows = states[rot % len(states)]
+        px = piece["x"] + dx
+        py = piece["y"] + dy
+        left = px + min_dx
+        if left < 0 or px + max_dx >= self.cols or py + max_dy >= self.rows:
+            return False
+        row_mask = self.row_mask
+        for row_off, bits in piece_rows:
+            y = py + row_off
+            if row_mask[y] & (bits << left):
                 return False
         return True
 
@@ -353,7 +458,7 @@ class NostalgiKitTetris:
         if self.can_place(self.current_piece, dx, dy):
             self.current_piece["x"] += dx
             self.current_piece["y"] += dy
-            self.draw()
+            self.request_draw()
             return True
         return False
 
@@ -371,7 +476,9 @@ class NostalgiKitTetris:
         elif self.can_place(self.current_piece, dx=1, rotation=new_rot):
             self.current_piece["x"] += 1
             self.current_piece["rotation"] = new_rot
-        self.draw()
+        else:
+            return  # Blocked: nothing moved
+        self.request_draw()
 
     def soft_drop(self):
         if not self.current_piece:
@@ -380,10 +487,28 @@ class NostalgiKitTetris:
             self.lock_piece()
 
     def hard_drop(self):
-        if not self.current_piece:
+        piece = self.current_piece
+        if not piece:
             return
-        while self.move_piece(0, 1):
-            self.score += 1
+        # Slide the piece's row bits down until one would overlap the stack
+        states = self._piece_rows[piece["shape"]]
+        min_dx, _, max_dy, piece_rows = states[piece["rotation"] % len(states)]
+        left = piece["x"] + min_dx
+        row_mask = self.row_mask
+        last_y = self.rows - 1 - max_dy
+        y = piece["y"]
+        while y < last_y:
+            below = y + 1
+            for row_off, bits in piece_rows:
+                row = below + row_off
+                if row_mask[row] & (bits << left):
+                    break
+            else:
+                y = below
+                continue
+            break
+        self.score += y - piece["y"]
+        piece["y"] = y
         self.lock_piece()
         self.update_hud()
 
@@ -394,18 +519,22 @@ class NostalgiKitTetris:
             if y < 0:
                 self.trigger_game_over()
                 return
-            self.grid[y][x] = self.current_piece["color"]
+            self.grid[y * self.cols + x] = self.current_piece["color_id"]
+            self.row_mask[y + self._top_pad] |= 1 << x
         self.clear_lines()
         self.spawn_piece()
 
     def clear_lines(self):
-        full_rows = [i for i, row in enumerate(self.grid) if all(cell is not None for cell in row)]
+        pad = self._top_pad
+        full_rows = [i for i, mask in enumerate(self.row_mask[pad:]) if mask == self._full_row_mask]
         if not full_rows:
             return
+        cols = self.cols
         for idx in reversed(full_rows):
-            del self.grid[idx]
-        for _ in full_rows:
-            self.grid.insert(0, [None for _ in range(self.cols)])
+            del self.grid[idx * cols:(idx + 1) * cols]
+            del self.row_mask[idx + pad]
+        self.grid[0:0] = bytes(cols * len(full_rows))
+        self.row_mask[pad:pad] = [0] * len(full_rows)
         cleared = len(full_rows)
         self.lines += cleared
         self.score += [0, 40, 100, 300, 800][cleared] * max(1, self.level)
@@ -419,39 +548,59 @@ class NostalgiKitTetris:
     # ------------------------------------------------------------------
     # Rendering
     # ------------------------------------------------------------------
+    def request_draw(self):
+        # Moves made before Tk goes idle share one draw
+        self._dirty = True
+        if self._draw_job is None:
+            self._draw_job = self.parent.after_idle(self._flush_draw)
+
+    def _flush_draw(self):
+        self._draw_job = None
+        if self._dirty:
+            self._dirty = False
+            self.draw()
+
+    def cancel_draw(self):
+        self._dirty = False
+        if self._draw_job is not None:
+            try:
+                self.parent.after_cancel(self._draw_job)
+            except Exception:
+                pass
+            self._draw_job = None
+
     def draw(self):
-        self.canvas.delete("all")
-        # Settled blocks
-        for y in range(self.rows):
-            for x in range(self.cols):
-                color = self.grid[y][x]
-                if color:
-                    self.draw_block(x, y, color)
-        # Active piece
-        if self.current_piece:
-            for x, y in self.piece_cells(self.current_piece):
-                if y >= 0:
-                    self.draw_block(x, y, self.current_piece["color"])
-        # Grid lines for clarity
-        for x in range(self.cols + 1):
+        # Settled blocks: only cells whose colour changed since the last frame
+        grid = self.grid
+        prev = self._prev_grid
+        if grid != prev:
+            for i, color_id in enumerate(grid):
+                if color_id != prev[i]:
+                    if color_id:
+                        self.canvas.itemconfigure(
+                            self.cell_ids[i], fill=self._cell_colors[color_id], state="normal"
+                        )
+                    else:
+                        self.canvas.itemconfigure(self.cell_ids[i], state="hidden")
+            prev[:] = grid
+        # Active piece: move its four blocks
+        if not self.current_piece:
+            if self._piece_shown:
+                self.canvas.itemconfigure("piece", state="hidden")
+                self._piece_shown = False
+            return
+        if self.current_piece["color"] != self._piece_color:
+            self._piece_color = self.current_piece["color"]
+            self.canvas.itemconfigure("piece", fill=self._piece_color)
+        if not self._piece_shown:
+            self.canvas.itemconfigure("piece", state="normal")
+            self._piece_shown = True
+        for item, (x, y) in zip(self.piece_ids, self.piece_cells(self.current_piece)):
+            if y < 0:
+                y = -1  # Above the playfield, out of sight
             px = x * self.block
-            self.canvas.create_line(px, 0, px, self.canvas_height, fill=self.colors["screen_dark"], width=1)
-        for y in range(self.rows + 1):
             py = y * self.block
-            self.canvas.create_line(0, py, self.canvas_width, py, fill=self.colors["screen_dark"], width=1)
-        self.draw_preview()
-
-    def draw_block(self, x, y, color):
-        px = x * self.block
-        py = y * self.block
-        self.canvas.create_rectangle(
-            px + 1,
-            py + 1,
-            px + self.block - 1,
-            py + self.block - 1,
-            fill=color,
-            outline=self.colors["screen_green"],
-        )
+            self.canvas.coords(item, px + 1, py + 1, px + self.block - 1, py + self.block - 1)
 
     def draw_preview(self):
         self.preview.delete("all")
@@ -473,19 +622,29 @@ class NostalgiKitTetris:
             )
 
     def update_hud(self):
-        self.score_label.config(text=f"SCORE:{self.score:04d}")
-        self.lines_label.config(text=f"LINES:{self.lines}")
-        self.level_label.config(text=f"LVL:{self.level}")
+        cache = self._hud_cache
+        if self.score != cache["score"]:
+            cache["score"] = self.score
+            self.score_label.config(text=f"SCORE:{self.score:04d}")
+        if self.lines != cache["lines"]:
+            cache["lines"] = self.lines
+            self.lines_label.config(text=f"LINES:{self.lines}")
+        if self.level != cache["level"]:
+            cache["level"] = self.level
+            self.level_label.config(text=f"LVL:{self.level}")
 
     def trigger_game_over(self):
         self.game_over = True
         self.game_active = False
         self.status_label.config(text="GAME OVER")
         self.cancel_loop()
-        self.canvas.create_rectangle(0, 110, self.canvas_width, 180, fill=self.colors["screen_dark"], outline="")
+        self.canvas.create_rectangle(
+            0, 110, self.canvas_width, 180, fill=self.colors["screen_dark"], outline="", tags=("overlay",)
+        )
         self.canvas.create_text(
             self.canvas_width // 2,
             140,
+            tags=("overlay",),
             text="GAME OVER",
             font=self.fonts["retro_title"],
             fill=self.colors["highlight"],
@@ -493,6 +652,7 @@ class NostalgiKitTetris:
         self.canvas.create_text(
             self.canvas_width // 2,
             165,
+            tags=("overlay",),
             text="X=RESTART  Y=MENU",
             font=self.fonts["retro_tiny"],
             fill=self.colors["nostalgik_cream"],
@@ -546,6 +706,7 @@ class NostalgiKitTetris:
 
     def exit_to_hub(self):
         self.cancel_loop()
+        self.cancel_draw()
         self.game_active = False
         self.gamepad_polling_active = False
         self.unbind_keys()
@@ -554,75 +715,73 @@ class NostalgiKitTetris:
     # ------------------------------------------------------------------
     # Gamepad support
     # ------------------------------------------------------------------
+    @property
+    def gamepad_polling_active(self):
+        return self._gamepad_active
+
+    @gamepad_polling_active.setter
+    def gamepad_polling_active(self, active):
+        # (Un)subscribes from the shared gamepad poller
+        if active and not self._gamepad_active:
+            poller.subscribe(self.parent, self.on_gamepad_button, self.on_gamepad_hat)
+        elif not active and self._gamepad_active:
+            poller.unsubscribe(self.on_gamepad_button)
+            self.stop_hat_repeat()
+        self._gamepad_active = active
+
     def init_gamepad(self):
         try:
-            if not pygame.get_init():
-                pygame.init()
-            if not pygame.joystick.get_init():
-                pygame.joystick.init()
-            self.joystick = None
+            poller.start()
             self.gamepad_enabled = True
             self.gamepad_polling_active = True
-            self.last_button_state = {}
-            if pygame.joystick.get_count() > 0:
-                self.joystick = pygame.joystick.Joystick(0)
-                self.joystick.init()
-            self.parent.winfo_toplevel().after(40, self.poll_gamepad)
         except Exception as e:
             print(f"Gamepad init error (tetris): {e}")
             self.gamepad_enabled = False
-            self.gamepad_polling_active = False
 
-    def poll_gamepad(self):
-        if not getattr(self, "gamepad_enabled", False) or not getattr(self, "gamepad_polling_active", False):
+    def on_gamepad_button(self, button):
+        # The game may have exited since this event was queued
+        if not self.gamepad_polling_active:
             return
-        try:
-            pygame.event.pump()
-            if self.joystick is not None and self.joystick.get_init():
-                def is_pressed(btn):
-                    try:
-                        return self.joystick.get_button(btn) == 1
-                    except Exception:
-                        return False
-
-                def just_pressed(btn):
-                    current = is_pressed(btn)
-                    previous = self.last_button_state.get(btn, False)
-                    self.last_button_state[btn] = current
-                    return current and not previous
-
-                if just_pressed(0) or just_pressed(2):  # A or X
-                    self.x_button_action()
-                if just_pressed(1) or just_pressed(3):  # B or Y
-                    self.y_button_action()
-                if just_pressed(7):  # START
-                    if self.game_active:
-                        self.toggle_pause()
-                    else:
-                        self.start_game_from_screen()
-
-                try:
-                    hat = self.joystick.get_hat(0)
-                except Exception:
-                    hat = (0, 0)
-                if hat == (-1, 0):
-                    self.dpad_left()
-                elif hat == (1, 0):
-                    self.dpad_right()
-                elif hat == (0, -1):
-                    self.dpad_down()
-                elif hat == (0, 1):
-                    self.dpad_up()
-        except KeyboardInterrupt:
-            raise
-        except Exception as e:
-            if "bad window" not in str(e):
-                print(f"Gamepad poll error (tetris): {e}")
-
-        try:
-            self.parent.winfo_toplevel().after(40, self.poll_gamepad)
-        except Exception:
-            pass
+        if button in (0, 2):  # A or X
+            self.x_button_action()
+        elif button in (1, 3):  # B or Y
+            self.y_button_action()
+        elif button == 7:  # START
+            if self.game_active:
+                self.toggle_pause()
+            else:
+                self.start_game_from_screen()
+
+    def on_gamepad_hat(self, value):
+        if not self.gamepad_polling_active:
+            return
+        self.stop_hat_repeat()
+        self.dpad_from_hat(value)
+        if value != (0, 0):
+            self._hat_job = self.parent.after(self.hat_repeat_ms, self.repeat_hat, value)
+
+    def repeat_hat(self, value):
+        # Auto-repeat while the direction is held; the release event stops it
+        self.dpad_from_hat(value)
+        self._hat_job = self.parent.after(self.hat_repeat_ms, self.repeat_hat, value)
+
+    def stop_hat_repeat(self):
+        if self._hat_job is not None:
+            try:
+                self.parent.after_cancel(self._hat_job)
+            except Exception:
+                pass
+            self._hat_job = None
+
+    def dpad_from_hat(self, hat):
+        if hat == (-1, 0):
+            self.dpad_left()
+        elif hat == (1, 0):
+            self.dpad_right()
+        elif hat == (0, -1):
+            self.dpad_down()
+        elif hat == (0, 1):
+            self.dpad_up()
 
     # ------------------------------------------------------------------
     # Reuse
@@ -632,7 +791,6 @@ class NostalgiKitTetris:
         self.show_title_screen()
         if getattr(self, "gamepad_enabled", False):
             self.gamepad_polling_active = True
-            self.parent.winfo_toplevel().after(80, self.poll_gamepad)
 
 
 # Alias for hub import
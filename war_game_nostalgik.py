@@ -7,12 +7,23 @@ Licensed under MIT License - see LICENSE file for details
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox
 import tkinter.font as tkFont
 import random
-import threading
-import time
-import pygame  # For gamepad support
+from gamepad_poller import poller  # For gamepad support
+from nostalgik_common import GAMEPAD_KEY_EVENTS
+
+# Lowercased keysym -> handler method name
+_KEY_MAP = {
+    # Direction keys
+    'up': 'dpad_up', 'w': 'dpad_up',
+    'down': 'dpad_down', 's': 'dpad_down',
+    'left': 'dpad_left', 'a': 'dpad_left',
+    'right': 'dpad_right', 'd': 'dpad_right',
+    # Action buttons
+    'return': 'x_button_action', 'space': 'x_button_action', 'x': 'x_button_action',
+    'escape': 'y_button_action', 'backspace': 'y_button_action', 'y': 'y_button_action',
+    'tab': 'exit_game',
+}
 
 class NostalgiKitWarGame:
     def __init__(self, parent, return_callback):
@@ -58,6 +69,15 @@ class NostalgiKitWarGame:
                 "desc": "Good HP, best healing"
             }
         }
+        # character_classes never changes, so its names are listed once
+        self._class_names = tuple(self.character_classes.keys())
+        self._class_count = len(self._class_names)
+        
+        # Battle sprites, rendered once per class (defaults before a class is chosen)
+        self._sprite_art = {name: f"{data['sprite']}\n/|\\\n/ \\"
+                            for name, data in self.character_classes.items()}
+        self._sprite_art_default_player = "♂\n/|\\\n/ \\"
+        self._sprite_art_default_enemy = "☠\n/|\\\n/ \\"
         
         # Game state
         self.selected_character = 0
@@ -79,6 +99,9 @@ class NostalgiKitWarGame:
         # Dynamic actions based on character
         self.actions = []
         
+        # Health bar text for 0-10 filled segments
+        self._bar_cache = ["[" + "█" * i + "░" * (10 - i) + "]" for i in range(11)]
+        
         self.defending = False
         self.enemy_defending = False
         self.special_cooldown = 0
@@ -97,7 +120,9 @@ class NostalgiKitWarGame:
         }
         
         self.current_screen = "intro"
+        self._gamepad_active = False
         self.gamepad_polling_active = True
+        self._keys_bound = False
         self.setup_fonts()
         self.setup_retro_interface()
         self.init_gamepad()
@@ -110,10 +135,10 @@ class NostalgiKitWarGame:
         special_data = char_data["special"]
         
         self.actions = [
-            {"name": "ATTACK", "desc": f"Deal {attack_min}-{attack_max} damage"},
-            {"name": "DEFEND", "desc": "Block 50% damage next turn"},
-            {"name": "HEAL", "desc": f"Restore {heal_min}-{heal_max} HP"},
-            {"name": special_data["name"], "desc": special_data["desc"]}
+            {"name": "ATTACK", "desc": f"Deal {attack_min}-{attack_max} damage", "is_special": False},
+            {"name": "DEFEND", "desc": "Block 50% damage next turn", "is_special": False},
+            {"name": "HEAL", "desc": f"Restore {heal_min}-{heal_max} HP", "is_special": False},
+            {"name": special_data["name"], "desc": special_data["desc"], "is_special": True}
         ]
         
     def setup_fonts(self):
@@ -137,11 +162,13 @@ class NostalgiKitWarGame:
         # Clear any previous content
         self.clear_screen()
         
-        # Setup keyboard bindings to root window
+        # Setup keyboard bindings to root window (once until exit_game unbinds them)
         root = self.parent.winfo_toplevel()
         root.focus_set()
-        root.bind('<Key>', self.on_key_press)
-        root.bind('<Button-1>', lambda e: root.focus_set())
+        if not self._keys_bound:
+            root.bind('<Key>', self.on_key_press)
+            root.bind('<Button-1>', lambda e: root.focus_set())
+            self._keys_bound = True
         
         # Start with intro
         self.show_intro()
@@ -150,114 +177,50 @@ class NostalgiKitWarGame:
     def init_gamepad(self):
         """Initialize gamepad support"""
         try:
-            if not pygame.get_init():
-                pygame.init()
-            if not pygame.joystick.get_init():
-                pygame.joystick.init()
-            
-            self.joystick = None
+            poller.start()
             self.gamepad_enabled = True
-            self.gamepad_polling_active = True
-            self.last_button_state = {}
-            self.last_hat = (0, 0)
-            
-            if pygame.joystick.get_count() > 0:
-                self.joystick = pygame.joystick.Joystick(0)
-                self.joystick.init()
-            
-            # Start gamepad polling with root window
-            root = self.parent.winfo_toplevel()
-            root.after(30, self.poll_gamepad)
-        except KeyboardInterrupt:
-            # Re-raise KeyboardInterrupt to allow proper program termination
-            raise
         except Exception as e:
             print(f"Gamepad init error: {e}")
             self.gamepad_enabled = False
     
-    def poll_gamepad(self):
-        """Poll gamepad input"""
-        if not self.gamepad_enabled or not self.gamepad_polling_active:
+    @property
+    def gamepad_polling_active(self):
+        """True while this game should react to gamepad input"""
+        return self._gamepad_active
+    
+    @gamepad_polling_active.setter
+    def gamepad_polling_active(self, active):
+        # (Un)subscribes from the shared gamepad poller
+        if active and not self._gamepad_active:
+            poller.subscribe(self.parent, self.on_gamepad_button, self.on_gamepad_hat)
+        elif not active and self._gamepad_active:
+            poller.unsubscribe(self.on_gamepad_button)
+        self._gamepad_active = active
+    
+    def on_gamepad_button(self, button):
+        """Turn a gamepad button press into the matching key press"""
+        # The game may have exited since this event was queued
+        if not self.gamepad_polling_active:
             return
-        
-        try:
-            self.parent.winfo_toplevel().winfo_exists()
-        except:
+        if button in (0, 2):  # A or X
+            self.on_key_press(GAMEPAD_KEY_EVENTS["Return"])
+        elif button in (1, 3):  # B or Y
+            self.on_key_press(GAMEPAD_KEY_EVENTS["Escape"])
+    
+    def on_gamepad_hat(self, value):
+        """Turn a D-Pad move into the matching key press"""
+        if not self.gamepad_polling_active:
             return
-        
-        try:
-            pygame.event.pump()
-            
-            if self.joystick is not None and self.joystick.get_init():
-                def is_pressed(btn):
-                    try:
-                        return self.joystick.get_button(btn) == 1
-                    except:
-                        return False
-                
-                def just_pressed(btn):
-                    current = is_pressed(btn)
-                    previous = self.last_button_state.get(btn, False)
-                    self.last_button_state[btn] = current
-                    return current and not previous
-                
-                # Simulate key presses
-                if just_pressed(0) or just_pressed(2):  # A or X
-                    event = type('Event', (), {'keysym': 'Return', 'char': '\r'})()
-                    self.on_key_press(event)
-                
-                if just_pressed(1) or just_pressed(3):  # B or Y
-                    event = type('Event', (), {'keysym': 'Escape', 'char': '\x1b'})()
-                    self.on_key_press(event)
-                
-                # D-Pad
-                try:
-                    hat = self.joystick.get_hat(0)
-                    if hat != self.last_hat:
-                        if hat == (0, 1):  # UP
-                            event = type('Event', (), {'keysym': 'Up', 'char': ''})()
-                            self.on_key_press(event)
-                        elif hat == (0, -1):  # DOWN
-                            event = type('Event', (), {'keysym': 'Down', 'char': ''})()
-                            self.on_key_press(event)
-                        self.last_hat = hat
-                except:
-                    pass
-        
-        except KeyboardInterrupt:
-            # Stop polling and re-raise to allow proper program termination
-            self.gamepad_polling_active = False
-            raise
-        except Exception as e:
-            if "bad window" not in str(e):
-                print(f"Gamepad poll error: {e}")
-        
-        try:
-            root = self.parent.winfo_toplevel()
-            root.after(30, self.poll_gamepad)
-        except:
-            pass
+        if value == (0, 1):  # UP
+            self.on_key_press(GAMEPAD_KEY_EVENTS["Up"])
+        elif value == (0, -1):  # DOWN
+            self.on_key_press(GAMEPAD_KEY_EVENTS["Down"])
     
     def on_key_press(self, event):
         """Handle keyboard input"""
-        key = event.keysym.lower()
-        
-        # Direction keys
-        if key in ['up', 'w']:
-            self.dpad_up()
-        elif key in ['down', 's']:
-            self.dpad_down()
-        elif key in ['left', 'a']:
-            self.dpad_left()
-        elif key in ['right', 'd']:
-            self.dpad_right()
-        # Action buttons
-        elif key in ['return', 'space', 'x']:
-            self.x_button_action()
-        elif key in ['escape', 'backspace', 'y']:
-            self.y_button_action()
-        elif key in ['tab']:
-            self.exit_game()
+        method = _KEY_MAP.get(event.keysym.lower())
+        if method is not None:
+            getattr(self, method)()
             
     def show_intro(self):
         """Show game introduction with character selection"""
@@ -287,20 +250,10 @@ class NostalgiKitWarGame:
         char_frame = tk.Frame(content, bg=self.colors['screen_green'])
         char_frame.pack(fill='both', expand=True, pady=5)
         
-        # Display characters
-        char_names = list(self.character_classes.keys())
-        for i, char_name in enumerate(char_names):
-            char_data = self.character_classes[char_name]
-            
-            if i == self.selected_character:
-                display_text = f"> {char_data['sprite']} {char_name}"
-                bg_color = self.colors['screen_dark']
-                fg_color = self.colors['screen_green']
-            else:
-                display_text = f"  {char_data['sprite']} {char_name}"
-                bg_color = self.colors['screen_green']
-                fg_color = self.colors['screen_dark']
-                
+        # Display characters (kept so selection changes only reconfigure rows)
+        self._char_labels = []
+        for i in range(self._class_count):
+            display_text, bg_color, fg_color = self.character_row(i)
             char_label = tk.Label(char_frame,
                                  text=display_text,
                                  font=self.fonts['retro_text'],
@@ -308,29 +261,19 @@ class NostalgiKitWarGame:
                                  bg=bg_color,
                                  anchor='w')
             char_label.pack(fill='x', padx=10, pady=1)
+            self._char_labels.append(char_label)
             
-        # Show selected character details
-        selected_char = char_names[self.selected_character]
-        char_data = self.character_classes[selected_char]
-        
-        # Character stats
+        # Character stats of the selected character
         stats_frame = tk.Frame(content, bg=self.colors['screen_green'])
         stats_frame.pack(fill='x', pady=5)
         
-        stats_text = f"""HP: {char_data['hp']}
-ATK: {char_data['attack'][0]}-{char_data['attack'][1]}
-HEAL: {char_data['heal'][0]}-{char_data['heal'][1]}
-SPECIAL: {char_data['special']['name']}
-
-{char_data['desc']}"""
-        
-        stats_label = tk.Label(stats_frame,
-                              text=stats_text,
-                              font=self.fonts['retro_tiny'],
-                              fg=self.colors['screen_dark'],
-                              bg=self.colors['screen_green'],
-                              justify='center')
-        stats_label.pack()
+        self._stats_label = tk.Label(stats_frame,
+                                    text=self.character_stats_text(),
+                                    font=self.fonts['retro_tiny'],
+                                    fg=self.colors['screen_dark'],
+                                    bg=self.colors['screen_green'],
+                                    justify='center')
+        self._stats_label.pack()
         
         # Score display
         if self.wins > 0 or self.losses > 0:
@@ -349,9 +292,36 @@ SPECIAL: {char_data['special']['name']}
                                  bg=self.colors['screen_green'])
         controls_label.pack(side='bottom', pady=2)
         
+    def character_row(self, i):
+        """Text and colors of character row i on the selection screen"""
+        char_name = self._class_names[i]
+        sprite = self.character_classes[char_name]['sprite']
+        if i == self.selected_character:
+            return f"> {sprite} {char_name}", self.colors['screen_dark'], self.colors['screen_green']
+        return f"  {sprite} {char_name}", self.colors['screen_green'], self.colors['screen_dark']
+    
+    def character_stats_text(self):
+        """Stats panel text for the selected character"""
+        char_name = self._class_names[self.selected_character]
+        char_data = self.character_classes[char_name]
+        return f"""HP: {char_data['hp']}
+ATK: {char_data['attack'][0]}-{char_data['attack'][1]}
+HEAL: {char_data['heal'][0]}-{char_data['heal'][1]}
+SPECIAL: {char_data['special']['name']}
+
+{char_data['desc']}"""
+    
+    def update_character_selection(self, previous):
+        """Repaint only the rows and stats touched by a selection change"""
+        for i in (previous, self.selected_character):
+            display_text, bg_color, fg_color = self.character_row(i)
+            self._char_labels[i].configure(text=display_text, bg=bg_color, fg=fg_color)
+        self._stats_label.configure(text=self.character_stats_text())
+        self.game_frame.update_idletasks()
+        
     def start_battle(self):
         """Start a new battle with selected character"""
-        char_names = list(self.character_classes.keys())
+        char_names = self._class_names
         self.player_class = char_names[self.selected_character]
         player_data = self.character_classes[self.player_class]
         
@@ -429,7 +399,11 @@ SPECIAL: {char_data['special']['name']}
         player_label.pack(side='left')
         
         # Player health bar
-        player_bar = self.create_health_bar(player_frame, self.player_hp, self.player_max_hp)
+        player_bar = tk.Label(player_frame,
+                             text=self.create_health_bar(self.player_hp, self.player_max_hp),
+                             font=self.fonts['retro_tiny'],
+                             fg=self.colors['screen_dark'],
+                             bg=self.colors['screen_green'])
         player_bar.pack(side='right', padx=5)
         
         # Enemy health
@@ -445,23 +419,16 @@ SPECIAL: {char_data['special']['name']}
         enemy_label.pack(side='left')
         
         # Enemy health bar
-        enemy_bar = self.create_health_bar(enemy_frame, self.enemy_hp, self.enemy_max_hp)
+        enemy_bar = tk.Label(enemy_frame,
+                             text=self.create_health_bar(self.enemy_hp, self.enemy_max_hp),
+                             font=self.fonts['retro_tiny'],
+                             fg=self.colors['screen_dark'],
+                             bg=self.colors['screen_green'])
         enemy_bar.pack(side='right', padx=5)
         
-    def create_health_bar(self, parent, current_hp, max_hp):
-        """Create a text-based health bar"""
-        bar_width = 10
-        filled = int((current_hp / max_hp) * bar_width)
-        empty = bar_width - filled
-        
-        bar_text = "█" * filled + "░" * empty
-        
-        bar_label = tk.Label(parent,
-                            text=f"[{bar_text}]",
-                            font=self.fonts['retro_tiny'],
-                            fg=self.colors['screen_dark'],
-                            bg=self.colors['screen_green'])
-        return bar_label
+    def create_health_bar(self, current_hp, max_hp):
+        """Text-based health bar for current_hp out of max_hp"""
+        return self._bar_cache[min(10, current_hp * 10 // max_hp) if max_hp else 0]
         
     def draw_battle_area(self, parent):
         """Draw the battle visualization with character sprites"""
@@ -469,14 +436,7 @@ SPECIAL: {char_data['special']['name']}
         battle_frame.pack(fill='x', pady=5)
         
         # Player side with character sprite
-        if self.player_class:
-            player_sprite = f"""{self.character_classes[self.player_class]['sprite']}
-/|\\
-/ \\"""
-        else:
-            player_sprite = """♂
-/|\\
-/ \\"""
+        player_sprite = self._sprite_art.get(self.player_class, self._sprite_art_default_player)
         
         player_label = tk.Label(battle_frame,
                                text=player_sprite,
@@ -495,14 +455,7 @@ SPECIAL: {char_data['special']['name']}
         vs_label.pack(side='left', expand=True)
         
         # Enemy side with character sprite
-        if self.enemy_class:
-            enemy_sprite = f"""{self.character_classes[self.enemy_class]['sprite']}
-/|\\
-/ \\"""
-        else:
-            enemy_sprite = """☠
-/|\\
-/ \\"""
+        enemy_sprite = self._sprite_art.get(self.enemy_class, self._sprite_art_default_enemy)
         
         enemy_label = tk.Label(battle_frame,
                               text=enemy_sprite,
@@ -544,27 +497,10 @@ SPECIAL: {char_data['special']['name']}
                              bg=self.colors['screen_green'])
         menu_label.pack()
         
-        # Actions
-        for i, action in enumerate(self.actions):
-            # Check if action is available
-            available = True
-            if action["name"] in ["RAGE", "FIREBALL", "BACKSTAB", "HOLY LIGHT"] and self.special_cooldown > 0:
-                available = False
-                
-            if i == self.selected_action and available:
-                display_text = f"> {action['name']}"
-                bg_color = self.colors['screen_dark']
-                fg_color = self.colors['screen_green']
-            else:
-                if available:
-                    display_text = f"  {action['name']}"
-                    bg_color = self.colors['screen_green']
-                    fg_color = self.colors['screen_dark']
-                else:
-                    display_text = f"  {action['name']} (CD)"
-                    bg_color = self.colors['screen_green']
-                    fg_color = self.colors['screen_dark']
-                    
+        # Actions (kept so selection changes only reconfigure rows)
+        self._action_labels = []
+        for i in range(len(self.actions)):
+            display_text, bg_color, fg_color = self.action_row(i)
             action_label = tk.Label(menu_frame,
                                    text=display_text,
                                    font=self.fonts['retro_small'],
@@ -572,15 +508,17 @@ SPECIAL: {char_data['special']['name']}
                                    bg=bg_color,
                                    anchor='w')
             action_label.pack(fill='x', padx=10)
+            self._action_labels.append(action_label)
             
         # Show description of selected action
+        self._action_desc_label = None
         if self.selected_action < len(self.actions):
-            desc_label = tk.Label(menu_frame,
-                                 text=self.actions[self.selected_action]["desc"],
-                                 font=self.fonts['retro_tiny'],
-                                 fg=self.colors['screen_dark'],
-                                 bg=self.colors['screen_green'])
-            desc_label.pack(pady=2)
+            self._action_desc_label = tk.Label(menu_frame,
+                                              text=self.actions[self.selected_action]["desc"],
+                                              font=self.fonts['retro_tiny'],
+                                              fg=self.colors['screen_dark'],
+                                              bg=self.colors['screen_green'])
+            self._action_desc_label.pack(pady=2)
             
         # Controls
         controls_label = tk.Label(menu_frame,
@@ -590,6 +528,27 @@ SPECIAL: {char_data['special']['name']}
                                  bg=self.colors['screen_green'])
         controls_label.pack(side='bottom', pady=2)
         
+    def action_row(self, i):
+        """Text and colors of action row i in the battle menu"""
+        action = self.actions[i]
+        # Check if action is available
+        available = not (action["is_special"] and self.special_cooldown > 0)
+            
+        if i == self.selected_action and available:
+            return f"> {action['name']}", self.colors['screen_dark'], self.colors['screen_green']
+        if available:
+            return f"  {action['name']}", self.colors['screen_green'], self.colors['screen_dark']
+        return f"  {action['name']} (CD)", self.colors['screen_green'], self.colors['screen_dark']
+    
+    def update_action_selection(self, previous):
+        """Repaint only the action rows and description touched by a selection change"""
+        for i in (previous, self.selected_action):
+            display_text, bg_color, fg_color = self.action_row(i)
+            self._action_labels[i].configure(text=display_text, bg=bg_color, fg=fg_color)
+        if self._action_desc_label is not None:
+            self._action_desc_label.configure(text=self.actions[self.selected_action]["desc"])
+        self.game_frame.update_idletasks()
+        
     def draw_game_over(self, parent):
         """Draw game over screen"""
         result_frame = tk.Frame(parent, bg=self.colors['screen_green'])
@@ -640,20 +599,24 @@ SPECIAL: {char_data['special']['name']}
     def dpad_up(self):
         """Handle D-Pad up"""
         if self.current_screen == "character_select":
-            self.selected_character = (self.selected_character - 1) % len(self.character_classes)
-            self.show_intro()
+            previous = self.selected_character
+            self.selected_character = (previous - 1) % self._class_count
+            self.update_character_selection(previous)
         elif self.current_screen == "battle" and not self.game_over:
-            self.selected_action = (self.selected_action - 1) % len(self.actions)
-            self.show_battle_screen()
+            previous = self.selected_action
+            self.selected_action = (previous - 1) % len(self.actions)
+            self.update_action_selection(previous)
             
     def dpad_down(self):
         """Handle D-Pad down"""
         if self.current_screen == "character_select":
-            self.selected_character = (self.selected_character + 1) % len(self.character_classes)
-            self.show_intro()
+            previous = self.selected_character
+            self.selected_character = (previous + 1) % self._class_count
+            self.update_character_selection(previous)
         elif self.current_screen == "battle" and not self.game_over:
-            self.selected_action = (self.selected_action + 1) % len(self.actions)
-            self.show_battle_screen()
+            previous = self.selected_action
+            self.selected_action = (previous + 1) % len(self.actions)
+            self.update_action_selection(previous)
             
     def dpad_left(self):
         """Handle D-Pad left"""
@@ -690,7 +653,7 @@ SPECIAL: {char_data['special']['name']}
         action = self.actions[self.selected_action]
         
         # Check if action is available
-        if action["name"] in ["RAGE", "FIREBALL", "BACKSTAB", "HOLY LIGHT"] and self.special_cooldown > 0:
+        if action["is_special"] and self.special_cooldown > 0:
             return
             
         player_data = self.character_classes[self.player_class]
@@ -712,7 +675,7 @@ SPECIAL: {char_data['special']['name']}
             self.player_hp = min(self.player_max_hp, self.player_hp + heal_amount)
             self.battle_log.append(f"You heal for {heal_amount} HP!")
             
-        elif action["name"] in ["RAGE", "FIREBALL", "BACKSTAB", "HOLY LIGHT"]:
+        elif action["is_special"]:
             special_data = player_data["special"]
             
             if action["name"] == "HOLY LIGHT":
@@ -848,6 +811,7 @@ SPECIAL: {char_data['special']['name']}
         root = self.parent.winfo_toplevel()
         root.unbind('<Key>')
         root.unbind('<Button-1>')
+        self._keys_bound = False
         
         # Clear the game frame and exit
         self.clear_screen()
@@ -881,8 +845,6 @@ SPECIAL: {char_data['special']['name']}
         # Gamepad'i yeniden başlat
         if self.gamepad_enabled:
             self.gamepad_polling_active = True
-            root = self.parent.winfo_toplevel()
-            root.after(100, self.poll_gamepad)
 
 # Update the import
 WarGame = NostalgiKitWarGame